@@ -3,12 +3,13 @@ API routes for Canvas MPC.
 Handles chat requests, tool execution, and authentication.
 """
 import os
+import asyncio
 from fastapi import APIRouter, HTTPException, Header, Query
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 import httpx
-import json
+import orjson
 import secrets
 
 from backend.services.mcp_service import MCPService
@@ -39,6 +40,60 @@ if not OPENROUTER_API_KEY:
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 MODEL = os.getenv("OPENROUTER_MODEL", "anthropic/claude-3.5-sonnet")
 
+# Request headers and system message are the same for every chat request, so
+# they are built once here rather than on every tool-call iteration.
+OPENROUTER_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+    "HTTP-Referer": os.getenv("BASE_URL", "http://localhost:8000"),
+    "X-Title": "Canvas MPC"
+}
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": """You are a helpful assistant that can interact with Canvas (course management), 
+Google Calendar, Gmail, and Flashcards. You have access to various tools to help users manage their courses, 
+schedule events, handle emails, and create study flashcards. 
+
+For flashcard creation (KEEP IT SIMPLE AND FAST):
+1. Get course: Use canvas_get_courses to find the course
+2. Get content: Use canvas_get_page_content for 1-2 key pages OR canvas_get_assignment_details for assignment info. DON'T fetch too much content.
+3. Create set: Use flashcard_create_set with course_id and course_name. Save the set_id.
+4. Generate: Use flashcard_generate with course_context (limit to key content, max 2-3 pages). Default generates 5 flashcards quickly.
+5. Add: Use flashcard_add_flashcards with the set_id and generated flashcards.
+
+IMPORTANT: Keep course_context short (1-2 pages max). Too much content causes timeouts. Prefer assignment descriptions over full page content when possible.
+
+Use the tools when needed to answer user queries."""
+}
+
+# Shared OpenRouter client (created on first use). HTTP/2 with keep-alive lets
+# consecutive chat iterations and concurrent requests reuse one connection
+# instead of paying a TLS handshake per chat request.
+_openrouter_client: Optional[httpx.AsyncClient] = None
+
+
+def get_openrouter_client() -> httpx.AsyncClient:
+    """Get or create the shared OpenRouter HTTP client."""
+    global _openrouter_client
+    
+    if _openrouter_client is None:
+        _openrouter_client = httpx.AsyncClient(
+            http2=True,
+            timeout=90.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+        )
+    return _openrouter_client
+
+
+async def close_openrouter_client():
+    """Close the shared OpenRouter HTTP client, if it was created."""
+    global _openrouter_client
+    
+    if _openrouter_client is not None:
+        await _openrouter_client.aclose()
+        _openrouter_client = None
+
 
 class ChatMessage(BaseModel):
     """Message in a conversation."""
@@ -59,6 +114,14 @@ class QueryResponse(BaseModel):
     tool_calls: Optional[List[Dict[str, Any]]] = []
 
 
+class ToolCall(NamedTuple):
+    """Tool call parsed from an assistant message."""
+    id: str
+    name: str
+    arguments: Dict[str, Any]
+    key: Tuple[str, bytes]  # (name, arguments JSON with sorted keys); equal for identical calls
+
+
 def parse_tool_name(function_name: str) -> Tuple[str, str]:
     """
     Parse function name to extract server and tool name.
@@ -77,6 +140,47 @@ def parse_tool_name(function_name: str) -> Tuple[str, str]:
         raise ValueError(f"Unknown function prefix: {function_name}")
 
 
+def build_chat_payload(messages: List[Dict[str, Any]], tools_json: bytes) -> bytes:
+    """
+    Build the OpenRouter request body as JSON bytes.
+    
+    Only the model/messages part is encoded per request; the tool schemas are
+    spliced in from MCPService's pre-serialized JSON.
+    
+    Args:
+        messages: Conversation messages to send
+        tools_json: Pre-serialized JSON array of tool schemas
+    
+    Returns:
+        JSON-encoded request body
+    """
+    body = orjson.dumps({
+        "model": MODEL,
+        "messages": messages,
+        "tool_choice": "auto",
+        "stream": True
+    })
+    return body[:-1] + b',"tools":' + tools_json + b'}'
+
+
+def parse_tool_call(tool_call: Dict[str, Any]) -> ToolCall:
+    """
+    Parse a tool call from an assistant message.
+    
+    Malformed argument JSON and a JSON null are treated as no arguments.
+    """
+    function_name = tool_call["function"]["name"]
+    try:
+        arguments = orjson.loads(tool_call["function"]["arguments"])
+    except orjson.JSONDecodeError:
+        arguments = {}
+    if arguments is None:
+        arguments = {}
+    
+    key = (function_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    return ToolCall(tool_call["id"], function_name, arguments, key)
+
+
 async def execute_tool_call(
     function_name: str, 
     arguments: Dict[str, Any],
@@ -95,6 +199,11 @@ async def execute_tool_call(
     """
     server_name, tool_name = parse_tool_name(function_name)
     
+    # Reject malformed arguments before touching any service
+    error = MCPService.validate_arguments(function_name, arguments)
+    if error:
+        return error
+    
     # Get user credentials if user_id is provided
     credentials = None
     if user_id:
@@ -112,6 +221,127 @@ async def execute_tool_call(
     return result
 
 
+async def stream_chat_turn(
+    client: httpx.AsyncClient,
+    payload: bytes,
+    headers: Dict[str, str],
+    user_id: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Stream one assistant turn from OpenRouter and run its tool calls.
+    
+    Each tool call is started as soon as its arguments are complete (when the
+    next tool call begins or the stream ends), so tool execution overlaps with
+    the rest of the LLM's output. Tool calls run concurrently, and identical
+    calls (same function and arguments) are executed once with the result
+    returned for each tool_call_id.
+    
+    Args:
+        client: Shared OpenRouter HTTP client
+        payload: JSON request body (with "stream": true)
+        headers: Request headers
+        user_id: Optional user ID for per-user credentials
+    
+    Returns:
+        Tuple of (assistant message, tool result messages in tool call order)
+    """
+    content_parts: List[str] = []
+    # Tool calls being assembled from deltas, by index (or by id for providers
+    # that omit the index), in the order they began
+    pending: Dict[Any, Dict[str, Any]] = {}
+    latest_slot: Any = 0
+    calls: List[Tuple[Dict[str, Any], ToolCall]] = []
+    tasks: Dict[Tuple[str, bytes], asyncio.Task] = {}
+    
+    def dispatch(slot: Any):
+        raw = pending.pop(slot)
+        raw["function"]["arguments"] = "".join(raw["function"]["arguments"])
+        call = parse_tool_call(raw)
+        calls.append((raw, call))
+        if call.key not in tasks:
+            tasks[call.key] = asyncio.create_task(
+                execute_tool_call(call.name, call.arguments, user_id)
+            )
+    
+    try:
+        async with client.stream("POST", OPENROUTER_API_URL, content=payload, headers=headers) as response:
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            
+            async for line in response.aiter_lines():
+                # Skip SSE comments/keep-alives such as ": OPENROUTER PROCESSING"
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                
+                chunk = orjson.loads(data)
+                if "error" in chunk:
+                    # Usually {"message": ..., "code": ...}, but may be a plain string
+                    error = chunk["error"]
+                    message = error.get("message", error) if isinstance(error, dict) else error
+                    raise ValueError(f"OpenRouter stream error: {message}")
+                if not chunk.get("choices"):
+                    continue
+                
+                delta = chunk["choices"][0].get("delta") or {}
+                if delta.get("content"):
+                    content_parts.append(delta["content"])
+                
+                for tool_delta in delta.get("tool_calls") or []:
+                    slot = tool_delta.get("index")
+                    if slot is None:
+                        # No index: a new id starts a new call, and id-less
+                        # deltas continue the latest one
+                        slot = tool_delta.get("id") or latest_slot
+                    if slot not in pending:
+                        # A new tool call began, so earlier ones are complete
+                        for previous in list(pending):
+                            dispatch(previous)
+                        pending[slot] = {
+                            "id": tool_delta.get("id"),
+                            "type": "function",
+                            "function": {"name": "", "arguments": []}
+                        }
+                    latest_slot = slot
+                    
+                    raw = pending[slot]
+                    if tool_delta.get("id"):
+                        raw["id"] = tool_delta["id"]
+                    function = tool_delta.get("function") or {}
+                    if function.get("name"):
+                        raw["function"]["name"] += function["name"]
+                    if function.get("arguments"):
+                        raw["function"]["arguments"].append(function["arguments"])
+        
+        for slot in list(pending):
+            dispatch(slot)
+        
+        results = await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    
+    result_by_key = dict(zip(tasks, results))
+    
+    assistant_message: Dict[str, Any] = {"role": "assistant", "content": "".join(content_parts)}
+    if calls:
+        assistant_message["tool_calls"] = [raw for raw, _ in calls]
+    
+    tool_results = [
+        {
+            "role": "tool",
+            "tool_call_id": call.id,
+            "content": result_by_key[call.key]
+        }
+        for _, call in calls
+    ]
+    return assistant_message, tool_results
+
+
 @router.post("/chat", response_model=QueryResponse)
 async def chat(
     request: QueryRequest,
@@ -143,25 +373,8 @@ async def chat(
             if session:
                 user_id = session['user_id']
         
-        # Build conversation messages
-        messages = []
-        
-        # Add system message
-        system_message = """You are a helpful assistant that can interact with Canvas (course management), 
-Google Calendar, Gmail, and Flashcards. You have access to various tools to help users manage their courses, 
-schedule events, handle emails, and create study flashcards. 
-
-For flashcard creation (KEEP IT SIMPLE AND FAST):
-1. Get course: Use canvas_get_courses to find the course
-2. Get content: Use canvas_get_page_content for 1-2 key pages OR canvas_get_assignment_details for assignment info. DON'T fetch too much content.
-3. Create set: Use flashcard_create_set with course_id and course_name. Save the set_id.
-4. Generate: Use flashcard_generate with course_context (limit to key content, max 2-3 pages). Default generates 5 flashcards quickly.
-5. Add: Use flashcard_add_flashcards with the set_id and generated flashcards.
-
-IMPORTANT: Keep course_context short (1-2 pages max). Too much content causes timeouts. Prefer assignment descriptions over full page content when possible.
-
-Use the tools when needed to answer user queries."""
-        messages.append({"role": "system", "content": system_message})
+        # Build conversation messages, starting with the system message
+        messages = [SYSTEM_MESSAGE]
         
         # Add conversation history
         for msg in request.conversation_history:
@@ -170,81 +383,42 @@ Use the tools when needed to answer user queries."""
         # Add current user query
         messages.append({"role": "user", "content": request.query})
         
-        # Get available tools
-        tools = MCPService.get_all_tools()
+        # Only offer the tools of servers relevant to this query and the
+        # user's recent messages
+        user_history = [msg.content for msg in request.conversation_history if msg.role == "user"]
+        tools_json = MCPService.get_tools_json(MCPService.select_tool_servers(request.query, user_history))
         
         # Call OpenRouter API
-        async with httpx.AsyncClient(timeout=90.0) as client:
-            max_iterations = 10  # Limit tool call iterations
-            iteration = 0
+        client = get_openrouter_client()
+        max_iterations = 10  # Limit tool call iterations
+        iteration = 0
+        
+        while iteration < max_iterations:
+            payload = build_chat_payload(messages, tools_json)
             
-            while iteration < max_iterations:
-                payload = {
-                    "model": MODEL,
-                    "messages": messages,
-                    "tools": tools,
-                    "tool_choice": "auto"
-                }
-                
-                # Get base URL from environment or use default
-                base_url = os.getenv("BASE_URL", "http://localhost:8000")
-                
-                headers = {
-                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": base_url,
-                    "X-Title": "Canvas MPC"
-                }
-                
-                response = await client.post(OPENROUTER_API_URL, json=payload, headers=headers)
-                response.raise_for_status()
-                response_data = response.json()
-                
-                # Extract assistant message
-                assistant_message = response_data["choices"][0]["message"]
-                messages.append(assistant_message)
-                
-                # Check if tool calls are needed
-                tool_calls = assistant_message.get("tool_calls", [])
-                
-                if not tool_calls:
-                    # No more tool calls, return the final response
-                    final_response = assistant_message.get("content", "")
-                    return QueryResponse(
-                        response=final_response,
-                        tool_calls=None
-                    )
-                
-                # Execute tool calls
-                tool_results = []
-                for tool_call in tool_calls:
-                    function_name = tool_call["function"]["name"]
-                    try:
-                        arguments = json.loads(tool_call["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        arguments = {}
-                    
-                    # Execute tool with user credentials
-                    tool_result = await execute_tool_call(function_name, arguments, user_id)
-                    
-                    # Add tool result to messages
-                    tool_results.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call["id"],
-                        "content": tool_result
-                    })
-                
-                # Add tool results to messages
-                messages.extend(tool_results)
-                
-                iteration += 1
+            # Stream the assistant turn; tool calls start while it is still streaming
+            assistant_message, tool_results = await stream_chat_turn(client, payload, OPENROUTER_HEADERS, user_id)
+            messages.append(assistant_message)
             
-            # If we've exceeded max iterations, return the last response
-            final_response = messages[-1].get("content", "Maximum iterations reached.")
-            return QueryResponse(
-                response=final_response,
-                tool_calls=None
-            )
+            if not tool_results:
+                # No more tool calls, return the final response
+                final_response = assistant_message.get("content", "")
+                return QueryResponse(
+                    response=final_response,
+                    tool_calls=None
+                )
+            
+            # Add tool results to messages
+            messages.extend(tool_results)
+            
+            iteration += 1
+        
+        # If we've exceeded max iterations, return the last response
+        final_response = messages[-1].get("content", "Maximum iterations reached.")
+        return QueryResponse(
+            response=final_response,
+            tool_calls=None
+        )
     
     except httpx.HTTPStatusError as e:
         raise HTTPException(
@@ -259,9 +433,19 @@ Use the tools when needed to answer user queries."""
 
 
 @router.get("/tools")
-async def get_tools():
-    """Get all available MCP tools."""
-    return {"tools": MCPService.get_all_tools()}
+async def get_tools(server: Optional[str] = Query(None, description="Only list the tools of this MCP server (canvas, calendar, gmail or flashcard)")):
+    """Get available MCP tools, optionally for a single server."""
+    if server is None:
+        tools_json = MCPService.get_all_tools_json()
+    elif server in MCPService.get_server_names():
+        tools_json = MCPService.get_tools_json(frozenset((server,)))
+    else:
+        raise HTTPException(status_code=404, detail=f"Unknown MCP server: {server}")
+    
+    return Response(
+        content=b'{"tools":' + tools_json + b'}',
+        media_type="application/json"
+    )
 
 
 @router.post("/auth/credentials")
@@ -10,7 +10,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import time
 
@@ -21,7 +21,7 @@ try:
 except ImportError:
     pass
 
-from backend.api.routes import router as api_router
+from backend.api.routes import router as api_router, close_openrouter_client
 from backend.utils.config import get_settings
 from backend.utils.monitoring import request_metrics, log_system_metrics
 from backend.services.mcp_service import health_check
@@ -58,6 +58,7 @@ async def lifespan(app: FastAPI):
         await metrics_task
     except asyncio.CancelledError:
         pass
+    await close_openrouter_client()
 
 
 # Create FastAPI app
@@ -67,6 +68,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if not settings.is_production else None,  # Disable docs in production
     redoc_url="/redoc" if not settings.is_production else None,
+    default_response_class=ORJSONResponse,  # Encode route responses with orjson
     lifespan=lifespan
 )
 
@@ -95,11 +97,11 @@ if settings.is_production:
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add request processing time header and track metrics."""
-    start_time = time.time()
+    start_time = time.monotonic()
     
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = time.monotonic() - start_time
         
         # Add headers
         response.headers["X-Process-Time"] = str(process_time)
@@ -115,7 +117,7 @@ async def add_process_time_header(request: Request, call_next):
         return response
     
     except Exception as e:
-        process_time = time.time() - start_time
+        process_time = time.monotonic() - start_time
         
         # Track error metrics
         request_metrics.record_request(
@@ -2,8 +2,9 @@
 
 import os
 import asyncio
+import functools
 from datetime import datetime, timedelta, timezone
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -13,7 +14,6 @@ try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
 except ImportError:
     raise ImportError(
@@ -21,17 +21,91 @@ except ImportError:
         "pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
     )
 
+from backend.utils.cache import TTLCache
+from backend.utils.google_http import build_service
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Load .env once at import, so the file-based credential paths can be resolved here
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+_TOKEN_PATH = os.getenv("CALENDAR_TOKEN_PATH", "data/tokens/calendar_token.json")
+_CREDENTIALS_PATH = os.getenv("CALENDAR_CREDENTIALS_PATH", "credentials.json")
+
+# The `timezone` parameter of the event helpers shadows datetime.timezone
+_UTC = timezone.utc
+
+# Google allows at most 50 calls in one batch request
+BATCH_MAX_REQUESTS = 50
+
+# Partial-response field masks: only the fields parse_event and the
+# formatters read, so responses skip reminders, conference data, etc.
+_EVENT_FIELDS = (
+    "id,summary,description,location,status,htmlLink,created,updated,"
+    "start(date,dateTime,timeZone),end(date,dateTime),attendees(email,responseStatus)"
+)
+_LIST_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken"
+_SYNC_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken,nextSyncToken"
+# List mask when recurring events are skipped; includes the fields that mark them
+_NON_RECURRING_LIST_FIELDS = f"items({_EVENT_FIELDS},recurrence,recurringEventId),nextPageToken"
+_CALENDAR_LIST_FIELDS = "items(id,summary,description,timeZone,primary,accessRole)"
+
 # Global Calendar service (initialized lazily)
 _calendar_service: Any = None
 
+# Per-user Calendar services, keyed by refresh token. The credentials refresh
+# their own access token, so a cached service stays usable.
+_user_services = TTLCache(max_entries=64, default_ttl=3600.0)
+
+# Recent list_calendars and get_event results, keyed by (account, ...) where the
+# account is the refresh token (None for file-based credentials). Event entries
+# are dropped when the event is updated or deleted.
+_read_cache = TTLCache(max_entries=256, default_ttl=30.0)
+
+
+# parse_event results, keyed by (event id, updated timestamp, htmlLink)
+_parsed_events = TTLCache(max_entries=1024, default_ttl=3600.0)
+
+
+def _account_key(credentials: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Get the cache key identifying whose calendars a call reads."""
+    return credentials.get("refresh_token") if credentials else None
+
+
+def _invalidate_events(credentials: Optional[Dict[str, Any]], calendar_id: str, event_ids: List[str]):
+    """Drop cached events after they change."""
+    account = _account_key(credentials)
+    stale = {(account, "event", calendar_id, event_id) for event_id in event_ids}
+    _read_cache.invalidate(lambda key: key in stale)
+
 # -----------------------------
 # AUTHENTICATION
 # -----------------------------
+def _save_token(token_path: str, creds):
+    """Write the token file atomically.
+    
+    A crash mid-write would otherwise leave a truncated token file, and the next
+    start would fall back to the interactive OAuth flow. The temp file is made
+    owner-only before anything is written, so the refresh token is never
+    readable by other users, not even briefly.
+    """
+    tmp_path = token_path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The mode above only applies on creation; cover a leftover temp file too
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, 'w') as token:
+        token.write(creds.to_json())
+        token.flush()
+        os.fsync(token.fileno())
+    os.replace(tmp_path, token_path)
+
 def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
     """Get or create the Calendar service. Initializes lazily to ensure credentials are available.
     
@@ -39,8 +113,14 @@ def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
         credentials: Optional credentials dictionary from Supabase. If provided, uses these
                      instead of file-based credentials.
     """
-    # If credentials are provided, use them directly (don't cache globally for per-user auth)
+    # If credentials are provided, use a per-user service keyed by refresh token, so
+    # a user's calls reuse one discovery document and HTTP connection
     if credentials:
+        cache_key = credentials.get("refresh_token")
+        service = _user_services.get(cache_key) if cache_key else None
+        if service is not None:
+            return service
+        
         try:
             creds = Credentials.from_authorized_user_info(credentials, SCOPES)
             
@@ -49,12 +129,16 @@ def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
                 creds.refresh(Request())
             
             # Build service with these credentials
-            return build('calendar', 'v3', credentials=creds)
+            service = build_service('calendar', 'v3', creds)
         except Exception as e:
             raise ValueError(
                 f"Failed to initialize Calendar service with provided credentials: {str(e)}. "
                 "Please check your credentials are valid."
             )
+        
+        if cache_key:
+            _user_services.set(cache_key, service)
+        return service
     
     # Otherwise, use file-based authentication (existing behavior)
     global _calendar_service
@@ -63,17 +147,8 @@ def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
         return _calendar_service
     
     creds = None
-    token_path = os.getenv("CALENDAR_TOKEN_PATH", "data/tokens/calendar_token.json")
-    credentials_path = os.getenv("CALENDAR_CREDENTIALS_PATH", "credentials.json")
-    
-    # Try to load from .env file
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-        token_path = os.getenv("CALENDAR_TOKEN_PATH", token_path)
-        credentials_path = os.getenv("CALENDAR_CREDENTIALS_PATH", credentials_path)
-    except ImportError:
-        pass
+    token_path = _TOKEN_PATH
+    credentials_path = _CREDENTIALS_PATH
     
     # The file token.json stores the user's access and refresh tokens
     if os.path.exists(token_path):
@@ -94,12 +169,11 @@ def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
             creds = flow.run_local_server(port=8080, prompt='consent')
         
         # Save the credentials for the next run
-        with open(token_path, 'w') as token:
-            token.write(creds.to_json())
+        _save_token(token_path, creds)
     
     # Build the Calendar service
     try:
-        _calendar_service = build('calendar', 'v3', credentials=creds)
+        _calendar_service = build_service('calendar', 'v3', creds)
         return _calendar_service
     except Exception as e:
         raise ValueError(
@@ -112,32 +186,71 @@ def get_calendar_service(credentials: Optional[Dict[str, Any]] = None):
 # -----------------------------
 app = Server("calendar-mcp-server")
 
+# Limits concurrent Calendar API calls from tool handlers, to stay clear of
+# Google's per-user rate limits
+_api_slots = asyncio.Semaphore(8)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking Calendar API helper in a worker thread.
+    
+    googleapiclient requests are synchronous; running them on the event loop
+    would stall every other tool call until Google responds.
+    """
+    async with _api_slots:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
 # -----------------------------
 # HELPER FUNCTIONS
 # -----------------------------
+class CalendarError(Exception):
+    """A Google Calendar API request failed."""
+
+
+def _wrap_http_errors(action: str):
+    """Decorator re-raising Calendar API HttpErrors as CalendarError.
+    
+    Args:
+        action: What the helper does, for the message ("An error occurred while {action}")
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except HttpError as error:
+                raise CalendarError(f"An error occurred while {action}: {error}") from error
+        return wrapper
+    return decorator
+
+@_wrap_http_errors("listing calendars")
 def list_calendars(credentials: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """List all calendars for the user.
     
     Args:
         credentials: Optional credentials dictionary from Supabase
     """
+    cache_key = (_account_key(credentials), "calendars")
+    cached = _read_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     service = get_calendar_service(credentials)
-    try:
-        calendar_list = service.calendarList().list().execute()
-        calendars = []
-        for calendar in calendar_list.get('items', []):
-            calendars.append({
-                'id': calendar['id'],
-                'summary': calendar.get('summary', 'No Title'),
-                'description': calendar.get('description', ''),
-                'timeZone': calendar.get('timeZone', ''),
-                'primary': calendar.get('primary', False),
-                'accessRole': calendar.get('accessRole', '')
-            })
-        return calendars
-    except HttpError as error:
-        raise Exception(f"An error occurred while listing calendars: {error}")
+    calendar_list = service.calendarList().list(fields=_CALENDAR_LIST_FIELDS).execute()
+    calendars = []
+    for calendar in calendar_list.get('items', []):
+        calendars.append({
+            'id': calendar['id'],
+            'summary': calendar.get('summary', 'No Title'),
+            'description': calendar.get('description', ''),
+            'timeZone': calendar.get('timeZone', ''),
+            'primary': calendar.get('primary', False),
+            'accessRole': calendar.get('accessRole', '')
+        })
+    _read_cache.set(cache_key, calendars)
+    return calendars
 
+@_wrap_http_errors("listing events")
 def get_calendar_events(
     calendar_id: str = 'primary',
     time_min: Optional[str] = None,
@@ -146,6 +259,7 @@ def get_calendar_events(
     query: Optional[str] = None,
     single_events: bool = True,
     order_by: str = 'startTime',
+    skip_recurring: bool = False,
     credentials: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
@@ -159,28 +273,101 @@ def get_calendar_events(
         query: Free text search terms
         single_events: Whether to expand recurring events into instances
         order_by: Order of events ('startTime' or 'updated')
+        skip_recurring: Leave out recurring events. Google then returns each series
+                        once instead of expanding its instances, and the events
+                        are ordered by last update.
         credentials: Optional credentials dictionary from Supabase
     
     Returns:
         List of event dictionaries
     """
+    fields = _LIST_FIELDS
+    if skip_recurring:
+        # Ordering by start time is only allowed for expanded instances
+        single_events = False
+        order_by = 'updated'
+        fields = _NON_RECURRING_LIST_FIELDS
+    
     service = get_calendar_service(credentials)
-    try:
+    events: List[Dict[str, Any]] = []
+    page_token = None
+    # Google may return fewer events than maxResults per page; follow
+    # nextPageToken until enough events have been collected
+    while True:
         events_result = service.events().list(
             calendarId=calendar_id,
             timeMin=time_min,
             timeMax=time_max,
-            maxResults=max_results,
+            maxResults=max_results - len(events),
             q=query,
             singleEvents=single_events,
-            orderBy=order_by
+            orderBy=order_by,
+            pageToken=page_token,
+            fields=fields
         ).execute()
         
-        events = events_result.get('items', [])
-        return events
-    except HttpError as error:
-        raise Exception(f"An error occurred while listing events: {error}")
+        items = events_result.get('items', [])
+        if skip_recurring:
+            items = [
+                event for event in items
+                if 'recurrence' not in event and 'recurringEventId' not in event
+            ]
+        events.extend(items)
+        page_token = events_result.get('nextPageToken')
+        if not page_token or len(events) >= max_results:
+            return events
+
+@_wrap_http_errors("syncing events")
+def sync_calendar_events(
+    calendar_id: str = 'primary',
+    sync_token: Optional[str] = None,
+    credentials: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Get the events that changed in a calendar since the last sync.
+    
+    The first call (or a call after the sync token expires) returns every event;
+    later calls return only events created, updated or cancelled since. The
+    sync token is not stored here: each caller keeps the token it was returned
+    and passes it back, so independent callers never consume each other's changes.
+    
+    Args:
+        calendar_id: Calendar ID (default: 'primary')
+        sync_token: Sync token returned by this caller's previous call (default: full sync)
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        (changed events, next sync token). Deleted events have status 'cancelled'.
+    """
+    service = get_calendar_service(credentials)
+    events: List[Dict[str, Any]] = []
+    page_token = None
+    while True:
+        try:
+            events_result = service.events().list(
+                calendarId=calendar_id,
+                syncToken=sync_token,
+                pageToken=page_token,
+                maxResults=2500,
+                fields=_SYNC_FIELDS
+            ).execute()
+        except HttpError as error:
+            # 410 Gone: the sync token expired; start over with a full sync
+            if error.resp.status != 410 or sync_token is None:
+                raise
+            sync_token = None
+            page_token = None
+            events = []
+            continue
+        
+        events.extend(events_result.get('items', []))
+        page_token = events_result.get('nextPageToken')
+        if not page_token:
+            break
+    
+    return events, events_result.get('nextSyncToken')
 
+@_wrap_http_errors("getting event")
 def get_event(calendar_id: str, event_id: str, credentials: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Get a specific event by ID.
     
@@ -189,14 +376,17 @@ def get_event(calendar_id: str, event_id: str, credentials: Optional[Dict[str, A
         event_id: Event ID
         credentials: Optional credentials dictionary from Supabase
     """
+    cache_key = (_account_key(credentials), "event", calendar_id, event_id)
+    cached = _read_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     service = get_calendar_service(credentials)
-    try:
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-        return event
-    except HttpError as error:
-        raise Exception(f"An error occurred while getting event: {error}")
+    event = service.events().get(calendarId=calendar_id, eventId=event_id, fields=_EVENT_FIELDS).execute()
+    _read_cache.set(cache_key, event)
+    return event
 
-def create_event(
+def _build_event_body(
     summary: str,
     description: Optional[str] = None,
     start_time: Optional[str] = None,
@@ -205,33 +395,10 @@ def create_event(
     end_date: Optional[str] = None,
     location: Optional[str] = None,
     attendees: Optional[List[str]] = None,
-    calendar_id: str = 'primary',
     timezone: str = 'UTC',
-    all_day: bool = False,
-    credentials: Optional[Dict[str, Any]] = None
+    all_day: bool = False
 ) -> Dict[str, Any]:
-    """
-    Create a new calendar event.
-    
-    Args:
-        summary: Event title (required)
-        description: Event description
-        start_time: Start time in ISO 8601 format (e.g., '2025-01-15T10:00:00')
-        end_time: End time in ISO 8601 format
-        start_date: Start date for all-day events (YYYY-MM-DD format)
-        end_date: End date for all-day events (YYYY-MM-DD format)
-        location: Event location
-        attendees: List of attendee email addresses
-        calendar_id: Calendar ID (default: 'primary')
-        timezone: Timezone (default: 'UTC')
-        all_day: Whether this is an all-day event
-        credentials: Optional credentials dictionary from Supabase
-    
-    Returns:
-        Created event dictionary
-    """
-    service = get_calendar_service(credentials)
-    
+    """Build the request body for a new event (see create_event for the arguments)."""
     # Build event body
     event = {
         'summary': summary,
@@ -245,21 +412,21 @@ def create_event(
     
     # Set start and end times
     if all_day:
-        # All-day event
+        # All-day event; the end date is exclusive, so a one-day event ends the next day
         if start_date:
             event['start'] = {'date': start_date}
         else:
             # Default to today
-            today = datetime.now().date().isoformat()
-            event['start'] = {'date': today}
+            start_day = datetime.now().date()
+            event['start'] = {'date': start_day.isoformat()}
         
         if end_date:
             event['end'] = {'date': end_date}
         else:
-            # Default to same day (all-day events end date is exclusive, so add 1 day)
-            start = event['start'].get('date', datetime.now().date().isoformat())
-            end_date_obj = datetime.fromisoformat(start) + timedelta(days=1)
-            event['end'] = {'date': end_date_obj.date().isoformat()}
+            # Default to same day
+            if start_date:
+                start_day = datetime.fromisoformat(start_date).date()
+            event['end'] = {'date': (start_day + timedelta(days=1)).isoformat()}
     else:
         # Timed event
         if start_time:
@@ -269,9 +436,9 @@ def create_event(
             }
         else:
             # Default to now
-            now = datetime.now(timezone.utc).isoformat()
+            start_dt = datetime.now(_UTC)
             event['start'] = {
-                'dateTime': now,
+                'dateTime': start_dt.isoformat(),
                 'timeZone': timezone
             }
         
@@ -282,10 +449,12 @@ def create_event(
             }
         else:
             # Default to 1 hour after start
-            start_dt = datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
-            end_dt = start_dt + timedelta(hours=1)
+            if start_time:
+                start_dt = datetime.fromisoformat(
+                    start_time[:-1] + '+00:00' if start_time.endswith('Z') else start_time
+                )
             event['end'] = {
-                'dateTime': end_dt.isoformat(),
+                'dateTime': (start_dt + timedelta(hours=1)).isoformat(),
                 'timeZone': timezone
             }
     
@@ -293,12 +462,62 @@ def create_event(
     if attendees:
         event['attendees'] = [{'email': email} for email in attendees]
     
-    try:
-        created_event = service.events().insert(calendarId=calendar_id, body=event).execute()
-        return created_event
-    except HttpError as error:
-        raise Exception(f"An error occurred while creating event: {error}")
+    return event
 
+@_wrap_http_errors("creating event")
+def create_event(
+    summary: str,
+    description: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    location: Optional[str] = None,
+    attendees: Optional[List[str]] = None,
+    calendar_id: str = 'primary',
+    timezone: str = 'UTC',
+    all_day: bool = False,
+    credentials: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Create a new calendar event.
+    
+    Args:
+        summary: Event title (required)
+        description: Event description
+        start_time: Start time in ISO 8601 format (e.g., '2025-01-15T10:00:00')
+        end_time: End time in ISO 8601 format
+        start_date: Start date for all-day events (YYYY-MM-DD format)
+        end_date: End date for all-day events (YYYY-MM-DD format)
+        location: Event location
+        attendees: List of attendee email addresses
+        calendar_id: Calendar ID (default: 'primary')
+        timezone: Timezone (default: 'UTC')
+        all_day: Whether this is an all-day event
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        Created event dictionary
+    """
+    service = get_calendar_service(credentials)
+    
+    event = _build_event_body(
+        summary=summary,
+        description=description,
+        start_time=start_time,
+        end_time=end_time,
+        start_date=start_date,
+        end_date=end_date,
+        location=location,
+        attendees=attendees,
+        timezone=timezone,
+        all_day=all_day
+    )
+    
+    created_event = service.events().insert(calendarId=calendar_id, body=event, fields=_EVENT_FIELDS).execute()
+    return created_event
+
+@_wrap_http_errors("updating event")
 def update_event(
     calendar_id: str,
     event_id: str,
@@ -331,57 +550,51 @@ def update_event(
     """
     service = get_calendar_service(credentials)
     
-    # Get the existing event
-    try:
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-    except HttpError as error:
-        raise Exception(f"An error occurred while getting event: {error}")
+    # Patch only the given fields; Google merges them into the stored event, so
+    # the event does not have to be fetched first
+    patch = {}
     
-    # Update fields
     if summary is not None:
-        event['summary'] = summary
+        patch['summary'] = summary
     
     if description is not None:
-        event['description'] = description
+        patch['description'] = description
     
     if location is not None:
-        event['location'] = location
+        patch['location'] = location
     
+    # Clearing 'date' converts an all-day event to a timed one
     if start_time is not None:
-        if 'date' in event.get('start', {}):
-            # Convert all-day to timed event
-            event['start'] = {
-                'dateTime': start_time,
-                'timeZone': timezone
-            }
-        else:
-            event['start']['dateTime'] = start_time
-            event['start']['timeZone'] = timezone
+        patch['start'] = {
+            'dateTime': start_time,
+            'timeZone': timezone,
+            'date': None
+        }
     
     if end_time is not None:
-        if 'date' in event.get('end', {}):
-            # Convert all-day to timed event
-            event['end'] = {
-                'dateTime': end_time,
-                'timeZone': timezone
-            }
-        else:
-            event['end']['dateTime'] = end_time
-            event['end']['timeZone'] = timezone
+        patch['end'] = {
+            'dateTime': end_time,
+            'timeZone': timezone,
+            'date': None
+        }
     
     if attendees is not None:
-        event['attendees'] = [{'email': email} for email in attendees]
+        patch['attendees'] = [{'email': email} for email in attendees]
     
+    # Invalidate once the write has finished, so a concurrent get_event cannot
+    # re-cache the old event in between
     try:
-        updated_event = service.events().update(
+        updated_event = service.events().patch(
             calendarId=calendar_id,
             eventId=event_id,
-            body=event
+            body=patch,
+            fields=_EVENT_FIELDS
         ).execute()
-        return updated_event
-    except HttpError as error:
-        raise Exception(f"An error occurred while updating event: {error}")
+    finally:
+        _invalidate_events(credentials, calendar_id, [event_id])
+    return updated_event
 
+@_wrap_http_errors("deleting event")
 def delete_event(calendar_id: str, event_id: str, credentials: Optional[Dict[str, Any]] = None) -> bool:
     """Delete a calendar event.
     
@@ -393,249 +606,530 @@ def delete_event(calendar_id: str, event_id: str, credentials: Optional[Dict[str
     service = get_calendar_service(credentials)
     try:
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-        return True
-    except HttpError as error:
-        raise Exception(f"An error occurred while deleting event: {error}")
+    finally:
+        _invalidate_events(credentials, calendar_id, [event_id])
+    return True
+
+@_wrap_http_errors("executing batch request")
+def _execute_batch(service, requests: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+    """Execute API requests as batch calls instead of one HTTP round trip each.
+    
+    Args:
+        service: Calendar service the requests were built from
+        requests: Unexecuted API requests (e.g. service.events().get(...))
+    
+    Returns:
+        (response, error) for each request, in request order
+    """
+    results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(requests)
+    
+    def callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+    
+    # Split into chunks of at most BATCH_MAX_REQUESTS calls
+    for offset in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=callback)
+        for index in range(offset, min(offset + BATCH_MAX_REQUESTS, len(requests))):
+            batch.add(requests[index], request_id=str(index))
+        batch.execute()
+    
+    return results
+
+def get_events_bulk(
+    event_ids: List[str],
+    calendar_id: str = 'primary',
+    credentials: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Get several events by ID in batched requests.
+    
+    Args:
+        event_ids: Event IDs to retrieve
+        calendar_id: Calendar ID (default: 'primary')
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        One {'event_id', 'event'} or {'event_id', 'error'} dictionary per event ID
+    """
+    service = get_calendar_service(credentials)
+    requests = [
+        service.events().get(calendarId=calendar_id, eventId=event_id, fields=_EVENT_FIELDS)
+        for event_id in event_ids
+    ]
+    
+    results = []
+    for event_id, (event, error) in zip(event_ids, _execute_batch(service, requests)):
+        if error is not None:
+            results.append({'event_id': event_id, 'error': str(error)})
+        else:
+            results.append({'event_id': event_id, 'event': event})
+    return results
+
+def create_events_bulk(
+    events: List[Dict[str, Any]],
+    calendar_id: str = 'primary',
+    credentials: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Create several events in batched requests.
+    
+    Args:
+        events: Event specifications, each taking the create_event arguments
+                (summary, description, start_time, end_time, start_date, end_date,
+                location, attendees, timezone, all_day)
+        calendar_id: Calendar ID (default: 'primary')
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        One {'summary', 'event'} or {'summary', 'error'} dictionary per event
+    """
+    service = get_calendar_service(credentials)
+    requests = [
+        service.events().insert(
+            calendarId=calendar_id,
+            fields=_EVENT_FIELDS,
+            body=_build_event_body(
+                summary=spec.get('summary'),
+                description=spec.get('description'),
+                start_time=spec.get('start_time'),
+                end_time=spec.get('end_time'),
+                start_date=spec.get('start_date'),
+                end_date=spec.get('end_date'),
+                location=spec.get('location'),
+                attendees=spec.get('attendees'),
+                timezone=spec.get('timezone', 'UTC'),
+                all_day=spec.get('all_day', False)
+            )
+        )
+        for spec in events
+    ]
+    
+    results = []
+    for spec, (event, error) in zip(events, _execute_batch(service, requests)):
+        if error is not None:
+            results.append({'summary': spec.get('summary'), 'error': str(error)})
+        else:
+            results.append({'summary': spec.get('summary'), 'event': event})
+    return results
+
+def delete_events_bulk(
+    event_ids: List[str],
+    calendar_id: str = 'primary',
+    credentials: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Delete several events in batched requests.
+    
+    Args:
+        event_ids: Event IDs to delete
+        calendar_id: Calendar ID (default: 'primary')
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        One {'event_id', 'deleted'} dictionary per event ID, with 'error' set on failure
+    """
+    service = get_calendar_service(credentials)
+    requests = [service.events().delete(calendarId=calendar_id, eventId=event_id) for event_id in event_ids]
+    try:
+        responses = _execute_batch(service, requests)
+    finally:
+        _invalidate_events(credentials, calendar_id, event_ids)
+    
+    results = []
+    for event_id, (_, error) in zip(event_ids, responses):
+        if error is not None:
+            results.append({'event_id': event_id, 'deleted': False, 'error': str(error)})
+        else:
+            results.append({'event_id': event_id, 'deleted': True})
+    return results
 
 def parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse a calendar event into a readable format."""
-    start = event.get('start', {})
-    end = event.get('end', {})
+    """Parse a calendar event into a readable format.
+    
+    Results are cached by (id, updated, htmlLink); Google bumps `updated` on every
+    change, so a cached entry can never be stale, and htmlLink differs per
+    calendar, so users sharing an event do not share entries. Callers must not
+    modify the result.
+    """
+    cache_key = (event.get('id'), event.get('updated'), event.get('htmlLink'))
+    if cache_key[0] and cache_key[1]:
+        parsed = _parsed_events.get(cache_key)
+        if parsed is None:
+            parsed = _parse_event(event)
+            _parsed_events.set(cache_key, parsed)
+        return parsed
+    return _parse_event(event)
+
+def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse a calendar event (uncached; see parse_event)."""
+    get = event.get
+    start = get('start', {})
+    end = get('end', {})
     
     # Handle all-day vs timed events
-    if 'date' in start:
+    is_all_day = 'date' in start
+    time_key = 'date' if is_all_day else 'dateTime'
+    
+    return {
+        'id': get('id'),
+        'summary': get('summary', '(No Title)'),
+        'description': get('description', ''),
+        'location': get('location', ''),
+        'start': start.get(time_key),
+        'end': end.get(time_key),
+        'is_all_day': is_all_day,
+        'timezone': start.get('timeZone', ''),
+        'attendees': [
+            {
+                'email': attendee.get('email'),
+                'responseStatus': attendee.get('responseStatus', 'needsAction')
+            }
+            for attendee in get('attendees', ())
+        ],
+        'status': get('status', ''),
+        'htmlLink': get('htmlLink', ''),
+        'created': get('created', ''),
+        'updated': get('updated', '')
+    }
+
+def _format_event_line(i: int, event: Dict[str, Any]) -> str:
+    """Format a raw event as a numbered list_events entry.
+    
+    Reads the raw event directly rather than through parse_event, which would
+    build a full parsed dictionary per event only for these few fields.
+    """
+    start = event.get('start', {})
+    end = event.get('end', {})
+    is_all_day = 'date' in start
+    if is_all_day:
         start_time = start.get('date')
         end_time = end.get('date')
-        is_all_day = True
     else:
         start_time = start.get('dateTime')
         end_time = end.get('dateTime')
-        is_all_day = False
-    
-    # Parse attendees
-    attendees = []
-    for attendee in event.get('attendees', []):
-        attendees.append({
-            'email': attendee.get('email'),
-            'responseStatus': attendee.get('responseStatus', 'needsAction')
-        })
     
-    return {
-        'id': event.get('id'),
-        'summary': event.get('summary', '(No Title)'),
-        'description': event.get('description', ''),
-        'location': event.get('location', ''),
-        'start': start_time,
-        'end': end_time,
-        'is_all_day': is_all_day,
-        'timezone': start.get('timeZone', ''),
-        'attendees': attendees,
-        'status': event.get('status', ''),
-        'htmlLink': event.get('htmlLink', ''),
-        'created': event.get('created', ''),
-        'updated': event.get('updated', '')
-    }
+    line = (
+        f"{i}. {event.get('summary', '(No Title)')}\n"
+        f"   Event ID: {event.get('id')}\n"
+        f"   Start: {start_time}\n"
+        f"   End: {end_time}\n"
+    )
+    location = event.get('location')
+    if location:
+        line += f"   Location: {location}\n"
+    if is_all_day:
+        line += "   Type: All-day event\n"
+    return line + "\n"
 
 # -----------------------------
 # MCP TOOLS
 # -----------------------------
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="list_calendars",
-            description="List all calendars accessible to the user",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_events",
-            description="List events from a calendar with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary')",
-                        "default": "primary"
-                    },
-                    "time_min": {
-                        "type": "string",
-                        "description": "Lower bound for event end time (ISO 8601 format, e.g., '2025-01-15T00:00:00Z')"
-                    },
-                    "time_max": {
-                        "type": "string",
-                        "description": "Upper bound for event start time (ISO 8601 format, e.g., '2025-01-20T23:59:59Z')"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of events to return (default: 10, max: 2500)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 2500
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Free text search terms to match against event fields"
-                    }
+# Tool definitions never change, so build them once at import instead of on every
+# list_tools request.
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="list_calendars",
+        description="List all calendars accessible to the user",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_events",
+        description="List events from a calendar with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_event",
-            description="Get detailed information about a specific calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary')",
-                        "default": "primary"
-                    },
-                    "event_id": {
-                        "type": "string",
-                        "description": "The ID of the event to retrieve"
-                    }
+                "time_min": {
+                    "type": "string",
+                    "description": "Lower bound for event end time (ISO 8601 format, e.g., '2025-01-15T00:00:00Z')"
                 },
-                "required": ["event_id"]
-            }
-        ),
-        Tool(
-            name="create_event",
-            description="Create a new calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "summary": {
-                        "type": "string",
-                        "description": "Event title (required)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Event description"
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO 8601 format (e.g., '2025-01-15T10:00:00' or '2025-01-15T10:00:00-08:00')"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO 8601 format (e.g., '2025-01-15T11:00:00')"
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date for all-day events (YYYY-MM-DD format)"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date for all-day events (YYYY-MM-DD format)"
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "Event location"
-                    },
-                    "attendees": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        },
-                        "description": "List of attendee email addresses"
-                    },
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary')",
-                        "default": "primary"
-                    },
-                    "timezone": {
-                        "type": "string",
-                        "description": "Timezone (default: 'UTC', e.g., 'America/Los_Angeles', 'Europe/London')",
-                        "default": "UTC"
-                    },
-                    "all_day": {
-                        "type": "boolean",
-                        "description": "Whether this is an all-day event (default: false)",
-                        "default": False
-                    }
+                "time_max": {
+                    "type": "string",
+                    "description": "Upper bound for event start time (ISO 8601 format, e.g., '2025-01-20T23:59:59Z')"
                 },
-                "required": ["summary"]
-            }
-        ),
-        Tool(
-            name="update_event",
-            description="Update an existing calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary')",
-                        "default": "primary"
-                    },
-                    "event_id": {
-                        "type": "string",
-                        "description": "The ID of the event to update"
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "New event title"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New event description"
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "New start time (ISO 8601 format)"
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of events to return (default: 10, max: 2500)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 2500
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Free text search terms to match against event fields"
+                },
+                "skip_recurring": {
+                    "type": "boolean",
+                    "description": "Leave out recurring events (default: false)",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="sync_events",
+        description="List the events that changed in a calendar since the sync_token from a previous call (all events when no token is given). Returns the next sync token to pass back.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "sync_token": {
+                    "type": "string",
+                    "description": "Sync token returned by your previous sync_events call; omit for a full sync"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_event",
+        description="Get detailed information about a specific calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "event_id": {
+                    "type": "string",
+                    "description": "The ID of the event to retrieve"
+                }
+            },
+            "required": ["event_id"]
+        }
+    ),
+    Tool(
+        name="create_event",
+        description="Create a new calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "summary": {
+                    "type": "string",
+                    "description": "Event title (required)"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Event description"
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "Start time in ISO 8601 format (e.g., '2025-01-15T10:00:00' or '2025-01-15T10:00:00-08:00')"
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "End time in ISO 8601 format (e.g., '2025-01-15T11:00:00')"
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date for all-day events (YYYY-MM-DD format)"
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date for all-day events (YYYY-MM-DD format)"
+                },
+                "location": {
+                    "type": "string",
+                    "description": "Event location"
+                },
+                "attendees": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "end_time": {
-                        "type": "string",
-                        "description": "New end time (ISO 8601 format)"
+                    "description": "List of attendee email addresses"
+                },
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone (default: 'UTC', e.g., 'America/Los_Angeles', 'Europe/London')",
+                    "default": "UTC"
+                },
+                "all_day": {
+                    "type": "boolean",
+                    "description": "Whether this is an all-day event (default: false)",
+                    "default": False
+                }
+            },
+            "required": ["summary"]
+        }
+    ),
+    Tool(
+        name="update_event",
+        description="Update an existing calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "event_id": {
+                    "type": "string",
+                    "description": "The ID of the event to update"
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "New event title"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New event description"
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "New start time (ISO 8601 format)"
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "New end time (ISO 8601 format)"
+                },
+                "location": {
+                    "type": "string",
+                    "description": "New location"
+                },
+                "attendees": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "location": {
-                        "type": "string",
-                        "description": "New location"
+                    "description": "New list of attendee email addresses"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone (default: 'UTC')",
+                    "default": "UTC"
+                }
+            },
+            "required": ["event_id"]
+        }
+    ),
+    Tool(
+        name="delete_event",
+        description="Delete a calendar event",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "event_id": {
+                    "type": "string",
+                    "description": "The ID of the event to delete"
+                }
+            },
+            "required": ["event_id"]
+        }
+    ),
+    Tool(
+        name="get_events_bulk",
+        description="Get several calendar events by ID in one batched request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "event_ids": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "attendees": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
+                    "description": "The IDs of the events to retrieve"
+                }
+            },
+            "required": ["event_ids"]
+        }
+    ),
+    Tool(
+        name="create_events_bulk",
+        description="Create several calendar events in one batched request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
+                },
+                "events": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "summary": {"type": "string"},
+                            "description": {"type": "string"},
+                            "start_time": {"type": "string"},
+                            "end_time": {"type": "string"},
+                            "start_date": {"type": "string"},
+                            "end_date": {"type": "string"},
+                            "location": {"type": "string"},
+                            "attendees": {
+                                "type": "array",
+                                "items": {
+                                    "type": "string"
+                                }
+                            },
+                            "timezone": {"type": "string"},
+                            "all_day": {"type": "boolean"}
                         },
-                        "description": "New list of attendee email addresses"
+                        "required": ["summary"]
                     },
-                    "timezone": {
-                        "type": "string",
-                        "description": "Timezone (default: 'UTC')",
-                        "default": "UTC"
-                    }
+                    "description": "Events to create; each takes the same fields as create_event"
+                }
+            },
+            "required": ["events"]
+        }
+    ),
+    Tool(
+        name="delete_events_bulk",
+        description="Delete several calendar events in one batched request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": "Calendar ID (default: 'primary')",
+                    "default": "primary"
                 },
-                "required": ["event_id"]
-            }
-        ),
-        Tool(
-            name="delete_event",
-            description="Delete a calendar event",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {
-                        "type": "string",
-                        "description": "Calendar ID (default: 'primary')",
-                        "default": "primary"
+                "event_ids": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "event_id": {
-                        "type": "string",
-                        "description": "The ID of the event to delete"
-                    }
-                },
-                "required": ["event_id"]
-            }
-        )
-    ]
+                    "description": "The IDs of the events to delete"
+                }
+            },
+            "required": ["event_ids"]
+        }
+    )
+)
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return list(_TOOLS)
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[TextContent]:
@@ -646,7 +1140,7 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
     try:
         if name == "list_calendars":
             try:
-                calendars = list_calendars()
+                calendars = await _run_blocking(list_calendars)
                 
                 if not calendars:
                     return [TextContent(
@@ -654,17 +1148,17 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                         text="No calendars found."
                     )]
                 
-                formatted = f"Found {len(calendars)} calendar(s):\n\n"
+                parts = [f"Found {len(calendars)} calendar(s):\n\n"]
                 for i, cal in enumerate(calendars, 1):
-                    formatted += f"{i}. {cal['summary']}\n"
-                    formatted += f"   ID: {cal['id']}\n"
-                    formatted += f"   Primary: {'Yes' if cal['primary'] else 'No'}\n"
-                    formatted += f"   Access: {cal['accessRole']}\n"
+                    parts.append(f"{i}. {cal['summary']}\n")
+                    parts.append(f"   ID: {cal['id']}\n")
+                    parts.append(f"   Primary: {'Yes' if cal['primary'] else 'No'}\n")
+                    parts.append(f"   Access: {cal['accessRole']}\n")
                     if cal['timeZone']:
-                        formatted += f"   Timezone: {cal['timeZone']}\n"
-                    formatted += "\n"
+                        parts.append(f"   Timezone: {cal['timeZone']}\n")
+                    parts.append("\n")
                 
-                return [TextContent(type="text", text=formatted)]
+                return [TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 return [TextContent(
                     type="text",
@@ -677,6 +1171,7 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
             time_max = arguments.get("time_max")
             max_results = arguments.get("max_results", 10)
             query = arguments.get("query")
+            skip_recurring = arguments.get("skip_recurring", False)
             
             if not isinstance(max_results, int) or max_results < 1:
                 max_results = 10
@@ -684,12 +1179,14 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 max_results = 2500
             
             try:
-                events = get_calendar_events(
+                events = await _run_blocking(
+                    get_calendar_events,
                     calendar_id=calendar_id,
                     time_min=time_min,
                     time_max=time_max,
                     max_results=max_results,
-                    query=query
+                    query=query,
+                    skip_recurring=skip_recurring
                 )
                 
                 if not events:
@@ -698,24 +1195,44 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                         text=f"No events found in calendar '{calendar_id}'."
                     )]
                 
-                formatted = f"Found {len(events)} event(s) in calendar '{calendar_id}':\n\n"
+                parts = [f"Found {len(events)} event(s) in calendar '{calendar_id}':\n\n"]
+                parts.extend(_format_event_line(i, event) for i, event in enumerate(events, 1))
+                
+                return [TextContent(type="text", text="".join(parts))]
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"Error listing events: {str(e)}"
+                )]
+        
+        elif name == "sync_events":
+            calendar_id = arguments.get("calendar_id", "primary")
+            sync_token = arguments.get("sync_token")
+            
+            try:
+                events, next_sync_token = await _run_blocking(
+                    sync_calendar_events,
+                    calendar_id=calendar_id,
+                    sync_token=sync_token
+                )
+                
+                parts = [f"{len(events)} event(s) changed in calendar '{calendar_id}':\n\n"]
                 for i, event in enumerate(events, 1):
                     parsed = parse_event(event)
-                    formatted += f"{i}. {parsed['summary']}\n"
-                    formatted += f"   Event ID: {parsed['id']}\n"
-                    formatted += f"   Start: {parsed['start']}\n"
-                    formatted += f"   End: {parsed['end']}\n"
-                    if parsed['location']:
-                        formatted += f"   Location: {parsed['location']}\n"
-                    if parsed['is_all_day']:
-                        formatted += f"   Type: All-day event\n"
-                    formatted += "\n"
+                    if parsed['status'] == 'cancelled':
+                        parts.append(f"{i}. [Deleted] Event ID: {parsed['id']}\n\n")
+                        continue
+                    parts.append(f"{i}. {parsed['summary']}\n")
+                    parts.append(f"   Event ID: {parsed['id']}\n")
+                    parts.append(f"   Start: {parsed['start']}\n")
+                    parts.append(f"   End: {parsed['end']}\n\n")
+                parts.append(f"Sync token: {next_sync_token}\n")
                 
-                return [TextContent(type="text", text=formatted)]
+                return [TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 return [TextContent(
                     type="text",
-                    text=f"Error listing events: {str(e)}"
+                    text=f"Error syncing events: {str(e)}"
                 )]
         
         elif name == "get_event":
@@ -729,28 +1246,28 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 )]
             
             try:
-                event = get_event(calendar_id, event_id)
+                event = await _run_blocking(get_event, calendar_id, event_id)
                 parsed = parse_event(event)
                 
-                formatted = "Event Details:\n\n"
-                formatted += f"Title: {parsed['summary']}\n"
-                formatted += f"Event ID: {parsed['id']}\n"
-                formatted += f"Start: {parsed['start']}\n"
-                formatted += f"End: {parsed['end']}\n"
-                formatted += f"All-day: {'Yes' if parsed['is_all_day'] else 'No'}\n"
+                parts = ["Event Details:\n\n"]
+                parts.append(f"Title: {parsed['summary']}\n")
+                parts.append(f"Event ID: {parsed['id']}\n")
+                parts.append(f"Start: {parsed['start']}\n")
+                parts.append(f"End: {parsed['end']}\n")
+                parts.append(f"All-day: {'Yes' if parsed['is_all_day'] else 'No'}\n")
                 if parsed['timezone']:
-                    formatted += f"Timezone: {parsed['timezone']}\n"
+                    parts.append(f"Timezone: {parsed['timezone']}\n")
                 if parsed['location']:
-                    formatted += f"Location: {parsed['location']}\n"
+                    parts.append(f"Location: {parsed['location']}\n")
                 if parsed['description']:
-                    formatted += f"Description: {parsed['description']}\n"
+                    parts.append(f"Description: {parsed['description']}\n")
                 if parsed['attendees']:
-                    formatted += f"Attendees: {', '.join([a['email'] for a in parsed['attendees']])}\n"
-                formatted += f"Status: {parsed['status']}\n"
+                    parts.append(f"Attendees: {', '.join([a['email'] for a in parsed['attendees']])}\n")
+                parts.append(f"Status: {parsed['status']}\n")
                 if parsed['htmlLink']:
-                    formatted += f"Link: {parsed['htmlLink']}\n"
+                    parts.append(f"Link: {parsed['htmlLink']}\n")
                 
-                return [TextContent(type="text", text=formatted)]
+                return [TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 return [TextContent(
                     type="text",
@@ -777,7 +1294,8 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
             all_day = arguments.get("all_day", False)
             
             try:
-                event = create_event(
+                event = await _run_blocking(
+                    create_event,
                     summary=summary,
                     description=description,
                     start_time=start_time,
@@ -792,19 +1310,19 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 )
                 parsed = parse_event(event)
                 
-                formatted = "✅ Event created successfully!\n\n"
-                formatted += f"Title: {parsed['summary']}\n"
-                formatted += f"Event ID: {parsed['id']}\n"
-                formatted += f"Start: {parsed['start']}\n"
-                formatted += f"End: {parsed['end']}\n"
+                parts = ["✅ Event created successfully!\n\n"]
+                parts.append(f"Title: {parsed['summary']}\n")
+                parts.append(f"Event ID: {parsed['id']}\n")
+                parts.append(f"Start: {parsed['start']}\n")
+                parts.append(f"End: {parsed['end']}\n")
                 if parsed['location']:
-                    formatted += f"Location: {parsed['location']}\n"
+                    parts.append(f"Location: {parsed['location']}\n")
                 if parsed['attendees']:
-                    formatted += f"Attendees: {', '.join([a['email'] for a in parsed['attendees']])}\n"
+                    parts.append(f"Attendees: {', '.join([a['email'] for a in parsed['attendees']])}\n")
                 if parsed['htmlLink']:
-                    formatted += f"Link: {parsed['htmlLink']}\n"
+                    parts.append(f"Link: {parsed['htmlLink']}\n")
                 
-                return [TextContent(type="text", text=formatted)]
+                return [TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 return [TextContent(
                     type="text",
@@ -830,7 +1348,8 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
             timezone = arguments.get("timezone", "UTC")
             
             try:
-                event = update_event(
+                event = await _run_blocking(
+                    update_event,
                     calendar_id=calendar_id,
                     event_id=event_id,
                     summary=summary,
@@ -843,17 +1362,17 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 )
                 parsed = parse_event(event)
                 
-                formatted = "✅ Event updated successfully!\n\n"
-                formatted += f"Title: {parsed['summary']}\n"
-                formatted += f"Event ID: {parsed['id']}\n"
-                formatted += f"Start: {parsed['start']}\n"
-                formatted += f"End: {parsed['end']}\n"
+                parts = ["✅ Event updated successfully!\n\n"]
+                parts.append(f"Title: {parsed['summary']}\n")
+                parts.append(f"Event ID: {parsed['id']}\n")
+                parts.append(f"Start: {parsed['start']}\n")
+                parts.append(f"End: {parsed['end']}\n")
                 if parsed['location']:
-                    formatted += f"Location: {parsed['location']}\n"
+                    parts.append(f"Location: {parsed['location']}\n")
                 if parsed['htmlLink']:
-                    formatted += f"Link: {parsed['htmlLink']}\n"
+                    parts.append(f"Link: {parsed['htmlLink']}\n")
                 
-                return [TextContent(type="text", text=formatted)]
+                return [TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 return [TextContent(
                     type="text",
@@ -871,7 +1390,7 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 )]
             
             try:
-                delete_event(calendar_id, event_id)
+                await _run_blocking(delete_event, calendar_id, event_id)
                 return [TextContent(
                     type="text",
                     text=f"✅ Event {event_id} deleted successfully from calendar '{calendar_id}'."
@@ -882,6 +1401,103 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                     text=f"Error deleting event: {str(e)}"
                 )]
         
+        elif name == "get_events_bulk":
+            calendar_id = arguments.get("calendar_id", "primary")
+            event_ids = arguments.get("event_ids")
+            
+            if not event_ids:
+                return [TextContent(
+                    type="text",
+                    text="Error: 'event_ids' is required to get events."
+                )]
+            
+            try:
+                results = await _run_blocking(get_events_bulk, event_ids, calendar_id=calendar_id)
+                
+                parts = [f"Retrieved {len(results)} event(s) from calendar '{calendar_id}':\n\n"]
+                for i, result in enumerate(results, 1):
+                    if 'error' in result:
+                        parts.append(f"{i}. Event {result['event_id']}: Error: {result['error']}\n\n")
+                        continue
+                    parsed = parse_event(result['event'])
+                    parts.append(f"{i}. {parsed['summary']}\n")
+                    parts.append(f"   Event ID: {parsed['id']}\n")
+                    parts.append(f"   Start: {parsed['start']}\n")
+                    parts.append(f"   End: {parsed['end']}\n")
+                    if parsed['location']:
+                        parts.append(f"   Location: {parsed['location']}\n")
+                    parts.append("\n")
+                
+                return [TextContent(type="text", text="".join(parts))]
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"Error retrieving events: {str(e)}"
+                )]
+        
+        elif name == "create_events_bulk":
+            calendar_id = arguments.get("calendar_id", "primary")
+            events = arguments.get("events")
+            
+            if not events:
+                return [TextContent(
+                    type="text",
+                    text="Error: 'events' is required to create events."
+                )]
+            if any(not event.get("summary") for event in events):
+                return [TextContent(
+                    type="text",
+                    text="Error: every event needs a 'summary'."
+                )]
+            
+            try:
+                results = await _run_blocking(create_events_bulk, events, calendar_id=calendar_id)
+                created = sum(1 for result in results if 'error' not in result)
+                
+                parts = [f"✅ Created {created} of {len(results)} event(s) in calendar '{calendar_id}':\n\n"]
+                for i, result in enumerate(results, 1):
+                    if 'error' in result:
+                        parts.append(f"{i}. {result['summary']}: Error: {result['error']}\n\n")
+                        continue
+                    parsed = parse_event(result['event'])
+                    parts.append(f"{i}. {parsed['summary']}\n")
+                    parts.append(f"   Event ID: {parsed['id']}\n")
+                    parts.append(f"   Start: {parsed['start']}\n")
+                    parts.append(f"   End: {parsed['end']}\n\n")
+                
+                return [TextContent(type="text", text="".join(parts))]
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"Error creating events: {str(e)}"
+                )]
+        
+        elif name == "delete_events_bulk":
+            calendar_id = arguments.get("calendar_id", "primary")
+            event_ids = arguments.get("event_ids")
+            
+            if not event_ids:
+                return [TextContent(
+                    type="text",
+                    text="Error: 'event_ids' is required to delete events."
+                )]
+            
+            try:
+                results = await _run_blocking(delete_events_bulk, event_ids, calendar_id=calendar_id)
+                deleted = sum(1 for result in results if result['deleted'])
+                
+                parts = [f"✅ Deleted {deleted} of {len(results)} event(s) from calendar '{calendar_id}'.\n"]
+                for result in results:
+                    if not result['deleted']:
+                        parts.append(f"   Event {result['event_id']}: Error: {result['error']}\n")
+                
+                return [TextContent(type="text", text="".join(parts))]
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"Error deleting events: {str(e)}"
+                )]
+        
         else:
             return [TextContent(
                 type="text",
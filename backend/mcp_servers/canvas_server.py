@@ -1,17 +1,44 @@
 # filename: mcp_server.py
 
 import os
+import time
+import random
 import asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
-from canvasapi import Canvas
-from canvasapi.exceptions import CanvasException
 from datetime import datetime, timedelta, timezone
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple, TYPE_CHECKING
 from functools import wraps
 from zoneinfo import ZoneInfo
 
+# canvasapi (and requests underneath it) is imported on first use by
+# _import_canvasapi(), so processes that never call Canvas skip loading it.
+if TYPE_CHECKING:
+    from canvasapi import Canvas
+    from canvasapi.course import Course
+
+class CanvasException(Exception):
+    """Stand-in for canvasapi.exceptions.CanvasException until canvasapi is imported.
+    
+    Every helper calls get_canvas_client() before talking to Canvas, which
+    rebinds this name to the real exception class, so `except CanvasException`
+    clauses work without importing canvasapi up front.
+    """
+
+def _import_canvasapi():
+    """Import canvasapi and bind Canvas/CanvasException module globals."""
+    global Canvas, CanvasException
+    from canvasapi import Canvas
+    from canvasapi.exceptions import CanvasException
+    return Canvas
+
+def __getattr__(name: str):
+    """Resolve `canvas_server.Canvas` lazily (PEP 562)."""
+    if name == "Canvas":
+        return _import_canvasapi()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
@@ -20,10 +47,53 @@ API_URL = "https://canvas.instructure.com"
 # Default timezone (can be overridden via environment variable)
 USER_TIMEZONE = ZoneInfo(os.getenv("USER_TIMEZONE", "UTC"))
 
+# Page size for Canvas list endpoints (Canvas defaults to 10 and allows up to 100),
+# so listing a course walks a tenth as many pages.
+PAGE_SIZE = 100
+
+# Shortest search_term Canvas list endpoints accept
+SEARCH_TERM_MIN_LENGTH = 2
+
+# Canvas rate limiting. X-Rate-Limit-Remaining reports the request budget left;
+# requests slow down below the warning threshold and pause below the blocking one.
+RATE_LIMIT_WARNING_THRESHOLD = 20.0
+RATE_LIMIT_BLOCKING_THRESHOLD = 10.0
+RATE_LIMIT_MAX_RETRIES = 3
+
 # Global canvas client (initialized lazily)
-_canvas_client: Optional[Canvas] = None
+_canvas_client: Optional["Canvas"] = None
 
-def get_canvas_client() -> Canvas:
+def _is_rate_limited(response) -> bool:
+    """Check whether Canvas throttled a response."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and "Rate Limit Exceeded" in response.text
+
+def _throttle_canvas_response(response, *args, **kwargs):
+    """requests response hook that adapts to the Canvas rate-limit budget.
+    
+    Throttled responses are retried with exponential backoff and jitter, and
+    the calling thread sleeps when X-Rate-Limit-Remaining runs low so that
+    the next request does not trip the throttle.
+    """
+    for attempt in range(RATE_LIMIT_MAX_RETRIES):
+        if not _is_rate_limited(response):
+            break
+        time.sleep(2 ** attempt + random.uniform(0, 0.5))
+        response = response.connection.send(response.request, **kwargs)
+    
+    try:
+        remaining = float(response.headers["X-Rate-Limit-Remaining"])
+    except (KeyError, ValueError):
+        return response
+    
+    if remaining < RATE_LIMIT_BLOCKING_THRESHOLD:
+        time.sleep(1.0)
+    elif remaining < RATE_LIMIT_WARNING_THRESHOLD:
+        time.sleep(0.25)
+    return response
+
+def get_canvas_client() -> "Canvas":
     """Get or create the Canvas client. Initializes lazily to ensure env vars are available."""
     global _canvas_client
     
@@ -54,13 +124,31 @@ def get_canvas_client() -> Canvas:
     
     # Initialize and cache the client
     try:
-        _canvas_client = Canvas(API_URL, API_KEY.strip())
-        return _canvas_client
+        _canvas_client = _import_canvasapi()(API_URL, API_KEY.strip())
     except Exception as e:
         raise ValueError(
             f"Failed to initialize Canvas client: {str(e)}. "
             f"Please check that your API_URL ({API_URL}) and API_KEY are correct."
         )
+    
+    # canvasapi sends everything through one requests.Session on its requester;
+    # hook it so every Canvas call respects the rate-limit budget.
+    requester = getattr(_canvas_client, "_Canvas__requester", None)
+    session = getattr(requester, "_session", None)
+    if session is not None:
+        session.hooks["response"].append(_throttle_canvas_response)
+    
+    return _canvas_client
+
+def get_course_ref(canvas: "Canvas", course_id) -> "Course":
+    """Build a Course object that only carries its ID, without fetching it.
+    
+    canvasapi formats every course-scoped path (courses/{id}/...) from the
+    Course object's id, so helpers that never read other course attributes
+    can skip the GET /courses/:id round-trip that canvas.get_course() issues.
+    """
+    from canvasapi.course import Course
+    return Course(getattr(canvas, "_Canvas__requester"), {"id": course_id})
 
 # -----------------------------
 # MCP SERVER
@@ -119,10 +207,60 @@ def fetch_courses() -> List[dict]:
     """Fetch all courses."""
     canvas = get_canvas_client()
     courses_list = []
-    for course in canvas.get_courses():
+    for course in canvas.get_courses(per_page=PAGE_SIZE):
         courses_list.append({"id": course.id, "name": course.name})
     return courses_list
 
+def fetch_assignments_batched(course_ids: List[Any]) -> Dict[Any, List[dict]]:
+    """Fetch the assignments of several courses in one GraphQL request.
+    
+    Each course becomes an aliased `course(id:)` selection in a single query,
+    so N courses cost one round-trip instead of N paginated REST listings.
+    Courses that GraphQL cannot serve in full (errors, or more than one page
+    of assignments) are left out and should be fetched over REST. Without a
+    filter, assignmentsConnection only returns the current grading period;
+    `gradingPeriodId: null` asks for all of them, as the REST listing does.
+    
+    Args:
+        course_ids: Canvas course IDs
+    
+    Returns:
+        Dict mapping course ID to a list of {name, due_at, points_possible, html_url}
+    """
+    if not course_ids:
+        return {}
+    
+    canvas = get_canvas_client()
+    variables = {f"c{i}": str(course_id) for i, course_id in enumerate(course_ids)}
+    selections = " ".join(
+        f"c{i}: course(id: $c{i}) {{ assignmentsConnection(first: {PAGE_SIZE}, filter: {{gradingPeriodId: null}}) "
+        f"{{ nodes {{ name dueAt pointsPossible htmlUrl }} pageInfo {{ hasNextPage }} }} }}"
+        for i in range(len(course_ids))
+    )
+    declarations = ", ".join(f"$c{i}: ID!" for i in range(len(course_ids)))
+    query = f"query UpcomingAssignments({declarations}) {{ {selections} }}"
+    
+    try:
+        data = canvas.graphql(query, variables=variables).get("data") or {}
+    except CanvasException:
+        return {}
+    
+    results = {}
+    for i, course_id in enumerate(course_ids):
+        connection = (data.get(f"c{i}") or {}).get("assignmentsConnection")
+        if not connection or connection["pageInfo"]["hasNextPage"]:
+            continue
+        results[course_id] = [
+            {
+                "name": node["name"],
+                "due_at": node["dueAt"],
+                "points_possible": node["pointsPossible"],
+                "html_url": node["htmlUrl"]
+            }
+            for node in connection["nodes"]
+        ]
+    return results
+
 def fetch_upcoming_assignments(days: int = 7) -> List[dict]:
     """Fetch assignments due in the next X days, with priority scoring."""
     canvas = get_canvas_client()
@@ -130,25 +268,32 @@ def fetch_upcoming_assignments(days: int = 7) -> List[dict]:
     end_date = now + timedelta(days=days)
     assignments = []
     courses = fetch_courses()
+    batched = fetch_assignments_batched([course["id"] for course in courses])
 
     for course in courses:
         try:
-            course_obj = canvas.get_course(course["id"])
-            for a in course_obj.get_assignments():
-                if a.due_at:
+            course_assignments = batched.get(course["id"])
+            if course_assignments is None:
+                # Fall back to REST for courses the GraphQL batch could not serve
+                course_assignments = [
+                    {"name": a.name, "due_at": a.due_at, "points_possible": a.points_possible, "html_url": a.html_url}
+                    for a in get_course_ref(canvas, course["id"]).get_assignments(per_page=PAGE_SIZE)
+                ]
+            for a in course_assignments:
+                if a["due_at"]:
                     # Convert Canvas UTC datetime to local timezone
-                    due_utc = datetime.fromisoformat(a.due_at.replace("Z", "+00:00"))
+                    due_utc = datetime.fromisoformat(a["due_at"].replace("Z", "+00:00"))
                     due_local = due_utc.astimezone(get_user_timezone())
                     
                     if now <= due_local <= end_date:
                         priority_score = 1 / ((due_local - now).total_seconds() / 3600 + 1)
                         assignments.append({
                             "course": course["name"],
-                            "title": a.name,
+                            "title": a["name"],
                             "due_date": format_datetime_local(due_local),
-                            "points": a.points_possible,
+                            "points": a["points_possible"],
                             "priority_score": round(priority_score, 2),
-                            "url": a.html_url
+                            "url": a["html_url"]
                         })
         except CanvasException:
             continue
@@ -195,12 +340,12 @@ def get_course_modules(course_id: int) -> List[dict]:
     """Get all modules for a course."""
     canvas = get_canvas_client()
     try:
-        course = canvas.get_course(course_id)
+        course = get_course_ref(canvas, course_id)
         modules = []
-        for module in course.get_modules():
+        for module in course.get_modules(per_page=PAGE_SIZE):
             module_items = []
             try:
-                for item in module.get_module_items():
+                for item in module.get_module_items(per_page=PAGE_SIZE):
                     module_items.append({
                         "id": item.id,
                         "title": item.title,
@@ -225,9 +370,9 @@ def get_course_files(course_id: int) -> List[dict]:
     """Get all files for a course."""
     canvas = get_canvas_client()
     try:
-        course = canvas.get_course(course_id)
+        course = get_course_ref(canvas, course_id)
         files = []
-        for file in course.get_files():
+        for file in course.get_files(per_page=PAGE_SIZE):
             files.append({
                 "id": file.id,
                 "display_name": file.display_name,
@@ -246,9 +391,9 @@ def get_course_pages(course_id: int) -> List[dict]:
     """Get all pages for a course."""
     canvas = get_canvas_client()
     try:
-        course = canvas.get_course(course_id)
+        course = get_course_ref(canvas, course_id)
         pages = []
-        for page in course.get_pages():
+        for page in course.get_pages(per_page=PAGE_SIZE):
             pages.append({
                 "url": page.url,
                 "title": page.title,
@@ -274,7 +419,7 @@ def get_page_content(course_id: int, page_url: str) -> dict:
     """
     canvas = get_canvas_client()
     try:
-        course = canvas.get_course(course_id)
+        course = get_course_ref(canvas, course_id)
         page = course.get_page(page_url)
         
         return {
@@ -314,7 +459,7 @@ def create_assignment(
         Dictionary with assignment details
     """
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     # Build assignment parameters
     assignment_params = {
@@ -536,7 +681,7 @@ def update_course_helper(
 ) -> dict:
     """Update a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     course_params = {}
     if name:
@@ -582,7 +727,7 @@ def delete_course_helper(course_id: int) -> dict:
 def fetch_assignment(course_id: int, assignment_id: int) -> dict:
     """Fetch a specific assignment."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     
     return {
@@ -609,7 +754,7 @@ def update_assignment_helper(
 ) -> dict:
     """Update an assignment."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     
     assignment_params = {}
@@ -649,7 +794,7 @@ def create_submission_helper(
 ) -> dict:
     """Create a submission for an assignment."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     
     submission_params = {
@@ -681,7 +826,7 @@ def create_submission_helper(
 def fetch_submission(course_id: int, assignment_id: int, user_id: int) -> dict:
     """Fetch a specific submission."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     submission = assignment.get_submission(user_id)
     
@@ -703,11 +848,11 @@ def fetch_submission(course_id: int, assignment_id: int, user_id: int) -> dict:
 def fetch_submissions(course_id: int, assignment_id: int) -> List[dict]:
     """Fetch all submissions for an assignment."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     
     submissions = []
-    for submission in assignment.get_submissions():
+    for submission in assignment.get_submissions(per_page=PAGE_SIZE):
         submissions.append({
             "id": submission.id,
             "user_id": submission.user_id,
@@ -733,7 +878,7 @@ def update_submission_helper(
 ) -> dict:
     """Update a submission (for grading or resubmission)."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     submission = assignment.get_submission(user_id)
     
@@ -765,7 +910,7 @@ def update_submission_helper(
 def delete_submission_helper(course_id: int, assignment_id: int, user_id: int) -> dict:
     """Delete a submission."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     assignment = course.get_assignment(assignment_id)
     submission = assignment.get_submission(user_id)
     
@@ -812,7 +957,7 @@ def create_quiz_helper(
 ) -> dict:
     """Create a quiz in a Canvas course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     quiz_params = {
         "title": title,
@@ -871,7 +1016,7 @@ def create_quiz_helper(
 def fetch_quiz(course_id: int, quiz_id: int) -> dict:
     """Fetch a specific quiz."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     return {
@@ -896,10 +1041,10 @@ def fetch_quiz(course_id: int, quiz_id: int) -> dict:
 def fetch_quizzes(course_id: int) -> List[dict]:
     """Fetch all quizzes for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     quizzes = []
-    for quiz in course.get_quizzes():
+    for quiz in course.get_quizzes(per_page=PAGE_SIZE):
         quizzes.append({
             "id": quiz.id,
             "title": quiz.title,
@@ -914,11 +1059,11 @@ def fetch_quizzes(course_id: int) -> List[dict]:
 def fetch_quiz_questions(course_id: int, quiz_id: int) -> List[dict]:
     """Fetch questions for a quiz."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     questions = []
-    for question in quiz.get_questions():
+    for question in quiz.get_questions(per_page=PAGE_SIZE):
         questions.append({
             "id": question.id,
             "question_name": getattr(question, 'question_name', None),
@@ -948,7 +1093,7 @@ def update_quiz_helper(
 ) -> dict:
     """Update a quiz."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     quiz_params = {}
@@ -991,7 +1136,7 @@ def update_quiz_helper(
 def delete_quiz_helper(course_id: int, quiz_id: int) -> dict:
     """Delete a quiz."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     quiz_info = {
@@ -1018,7 +1163,7 @@ def create_quiz_submission_helper(
 ) -> dict:
     """Create a quiz submission (start quiz attempt)."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     submission_params = {}
@@ -1041,7 +1186,7 @@ def create_quiz_submission_helper(
 def fetch_quiz_submission(course_id: int, quiz_id: int, submission_id: int) -> dict:
     """Fetch a specific quiz submission."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     submission = quiz.get_submission(submission_id)
     
@@ -1062,11 +1207,11 @@ def fetch_quiz_submission(course_id: int, quiz_id: int, submission_id: int) -> d
 def fetch_quiz_submissions(course_id: int, quiz_id: int) -> List[dict]:
     """Fetch all quiz submissions."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     
     submissions = []
-    for submission in quiz.get_submissions():
+    for submission in quiz.get_submissions(per_page=PAGE_SIZE):
         submissions.append({
             "id": submission.id,
             "user_id": submission.user_id,
@@ -1089,7 +1234,7 @@ def update_quiz_submission_helper(
 ) -> dict:
     """Update quiz submission score."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     submission = quiz.get_submission(submission_id)
     
@@ -1115,7 +1260,7 @@ def update_quiz_submission_helper(
 def delete_quiz_submission_helper(course_id: int, quiz_id: int, submission_id: int) -> dict:
     """Delete a quiz submission."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     quiz = course.get_quiz(quiz_id)
     submission = quiz.get_submission(submission_id)
     
@@ -1156,7 +1301,7 @@ def create_discussion_helper(
 ) -> dict:
     """Create a discussion topic."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     topic_params = {
         "title": title,
@@ -1189,7 +1334,7 @@ def create_discussion_helper(
 def fetch_discussion(course_id: int, topic_id: int) -> dict:
     """Fetch a specific discussion."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     discussion = course.get_discussion_topic(topic_id)
     
     return {
@@ -1207,10 +1352,10 @@ def fetch_discussion(course_id: int, topic_id: int) -> dict:
 def fetch_discussions(course_id: int) -> List[dict]:
     """Fetch all discussions for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     discussions = []
-    for discussion in course.get_discussion_topics():
+    for discussion in course.get_discussion_topics(per_page=PAGE_SIZE):
         discussions.append({
             "id": discussion.id,
             "title": discussion.title,
@@ -1224,11 +1369,11 @@ def fetch_discussions(course_id: int) -> List[dict]:
 def fetch_discussion_entries(course_id: int, topic_id: int) -> List[dict]:
     """Fetch entries (posts/replies) for a discussion."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     discussion = course.get_discussion_topic(topic_id)
     
     entries = []
-    for entry in discussion.get_entries():
+    for entry in discussion.get_entries(per_page=PAGE_SIZE):
         entries.append({
             "id": entry.id,
             "user_id": entry.user_id,
@@ -1250,7 +1395,7 @@ def update_discussion_helper(
 ) -> dict:
     """Update a discussion topic."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     discussion = course.get_discussion_topic(topic_id)
     
     topic_params = {}
@@ -1276,7 +1421,7 @@ def update_discussion_helper(
 def delete_discussion_helper(course_id: int, topic_id: int) -> dict:
     """Delete a discussion topic."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     discussion = course.get_discussion_topic(topic_id)
     
     discussion_info = {
@@ -1320,10 +1465,10 @@ def fetch_announcement(course_id: int, topic_id: int) -> dict:
 def fetch_announcements(course_id: int) -> List[dict]:
     """Fetch all announcements for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     announcements = []
-    for topic in course.get_discussion_topics(only_announcements=True):
+    for topic in course.get_discussion_topics(only_announcements=True, per_page=PAGE_SIZE):
         announcements.append({
             "id": topic.id,
             "title": topic.title,
@@ -1408,7 +1553,7 @@ def fetch_conversations() -> List[dict]:
     user = canvas.get_current_user()
     
     conversations = []
-    for conversation in user.get_conversations():
+    for conversation in user.get_conversations(per_page=PAGE_SIZE):
         conversations.append({
             "id": conversation.id,
             "subject": conversation.subject,
@@ -1479,7 +1624,7 @@ def create_module_helper(
 ) -> dict:
     """Create a module in a Canvas course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     module_params = {
         "name": name,
@@ -1509,7 +1654,7 @@ def create_module_helper(
 def fetch_module(course_id: int, module_id: int) -> dict:
     """Fetch a specific module."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     
     return {
@@ -1526,10 +1671,10 @@ def fetch_module(course_id: int, module_id: int) -> dict:
 def fetch_modules(course_id: int) -> List[dict]:
     """Fetch all modules for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     modules = []
-    for module in course.get_modules():
+    for module in course.get_modules(per_page=PAGE_SIZE):
         modules.append({
             "id": module.id,
             "name": module.name,
@@ -1543,11 +1688,11 @@ def fetch_modules(course_id: int) -> List[dict]:
 def fetch_module_items(course_id: int, module_id: int) -> List[dict]:
     """Fetch items in a module."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     
     items = []
-    for item in module.get_module_items():
+    for item in module.get_module_items(per_page=PAGE_SIZE):
         items.append({
             "id": item.id,
             "title": item.title,
@@ -1570,7 +1715,7 @@ def update_module_helper(
 ) -> dict:
     """Update a module."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     
     module_params = {}
@@ -1595,7 +1740,7 @@ def update_module_helper(
 def delete_module_helper(course_id: int, module_id: int) -> dict:
     """Delete a module."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     
     module_info = {
@@ -1629,7 +1774,7 @@ def create_module_item_helper(
 ) -> dict:
     """Create a module item."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     
     item_params = {
@@ -1664,7 +1809,7 @@ def create_module_item_helper(
 def fetch_module_item(course_id: int, module_id: int, item_id: int) -> dict:
     """Fetch a specific module item."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     item = module.get_module_item(item_id)
     
@@ -1689,7 +1834,7 @@ def update_module_item_helper(
 ) -> dict:
     """Update a module item."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     item = module.get_module_item(item_id)
     
@@ -1714,7 +1859,7 @@ def update_module_item_helper(
 def delete_module_item_helper(course_id: int, module_id: int, item_id: int) -> dict:
     """Delete a module item."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     module = course.get_module(module_id)
     item = module.get_module_item(item_id)
     
@@ -1745,7 +1890,7 @@ def create_page_helper(
 ) -> dict:
     """Create a wiki page."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     page_params = {
         "title": title,
@@ -1773,7 +1918,7 @@ def create_page_helper(
 def fetch_page(course_id: int, url: str) -> dict:
     """Fetch a specific page by URL."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     page = course.get_page(url)
     
     return {
@@ -1791,10 +1936,10 @@ def fetch_page(course_id: int, url: str) -> dict:
 def fetch_pages(course_id: int) -> List[dict]:
     """Fetch all pages for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     pages = []
-    for page in course.get_pages():
+    for page in course.get_pages(per_page=PAGE_SIZE):
         pages.append({
             "id": page.page_id,
             "title": page.title,
@@ -1815,7 +1960,7 @@ def update_page_helper(
 ) -> dict:
     """Update a page."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     page = course.get_page(url)
     
     page_params = {}
@@ -1841,7 +1986,7 @@ def update_page_helper(
 def delete_page_helper(course_id: int, url: str) -> dict:
     """Delete a page."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     page = course.get_page(url)
     
     page_info = {
@@ -1875,7 +2020,7 @@ def upload_file_helper(
 ) -> dict:
     """Upload a file to Canvas."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     if folder_id:
         folder = course.get_folder(folder_id)
@@ -1899,7 +2044,7 @@ def upload_file_helper(
 def fetch_file(course_id: int, file_id: int) -> dict:
     """Fetch a specific file."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     file_obj = course.get_file(file_id)
     
     return {
@@ -1918,13 +2063,19 @@ def fetch_file(course_id: int, file_id: int) -> dict:
 def fetch_files(course_id: int, folder_id: Optional[int] = None, search_term: Optional[str] = None) -> List[dict]:
     """Fetch files for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
+    
+    # Let Canvas filter by name so only matching files are paged in; it
+    # rejects search terms shorter than SEARCH_TERM_MIN_LENGTH
+    params = {"per_page": PAGE_SIZE}
+    if search_term and len(search_term) >= SEARCH_TERM_MIN_LENGTH:
+        params["search_term"] = search_term
     
     if folder_id:
         folder = course.get_folder(folder_id)
-        files_iter = folder.get_files()
+        files_iter = folder.get_files(**params)
     else:
-        files_iter = course.get_files()
+        files_iter = course.get_files(**params)
     
     files = []
     for file_obj in files_iter:
@@ -1950,7 +2101,7 @@ def update_file_helper(
 ) -> dict:
     """Update a file."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     file_obj = course.get_file(file_id)
     
     file_params = {}
@@ -1974,7 +2125,7 @@ def update_file_helper(
 def delete_file_helper(course_id: int, file_id: int) -> dict:
     """Delete a file."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     file_obj = course.get_file(file_id)
     
     file_info = {
@@ -2003,7 +2154,7 @@ def create_folder_helper(
 ) -> dict:
     """Create a folder."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     if parent_folder_id:
         parent_folder = course.get_folder(parent_folder_id)
@@ -2026,7 +2177,7 @@ def create_folder_helper(
 def fetch_folder(course_id: int, folder_id: int) -> dict:
     """Fetch a specific folder."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     folder = course.get_folder(folder_id)
     
     return {
@@ -2044,13 +2195,13 @@ def fetch_folder(course_id: int, folder_id: int) -> dict:
 def fetch_folders(course_id: int, folder_id: Optional[int] = None) -> List[dict]:
     """Fetch folders for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     if folder_id:
         parent_folder = course.get_folder(folder_id)
-        folders_iter = parent_folder.get_folders()
+        folders_iter = parent_folder.get_folders(per_page=PAGE_SIZE)
     else:
-        folders_iter = course.get_folders()
+        folders_iter = course.get_folders(per_page=PAGE_SIZE)
     
     folders = []
     for folder in folders_iter:
@@ -2074,7 +2225,7 @@ def update_folder_helper(
 ) -> dict:
     """Update a folder."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     folder = course.get_folder(folder_id)
     
     folder_params = {}
@@ -2097,7 +2248,7 @@ def update_folder_helper(
 def delete_folder_helper(course_id: int, folder_id: int) -> dict:
     """Delete a folder."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     folder = course.get_folder(folder_id)
     
     folder_info = {
@@ -2130,7 +2281,7 @@ def create_assignment_group_helper(
 ) -> dict:
     """Create an assignment group."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     group_params = {"name": name}
     if position is not None:
@@ -2154,7 +2305,7 @@ def create_assignment_group_helper(
 def fetch_assignment_group(course_id: int, group_id: int) -> dict:
     """Fetch a specific assignment group."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     group = course.get_assignment_group(group_id)
     
     return {
@@ -2170,10 +2321,10 @@ def fetch_assignment_group(course_id: int, group_id: int) -> dict:
 def fetch_assignment_groups(course_id: int) -> List[dict]:
     """Fetch all assignment groups for a course."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     
     groups = []
-    for group in course.get_assignment_groups():
+    for group in course.get_assignment_groups(per_page=PAGE_SIZE):
         groups.append({
             "id": group.id,
             "name": group.name,
@@ -2193,7 +2344,7 @@ def update_assignment_group_helper(
 ) -> dict:
     """Update an assignment group."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     group = course.get_assignment_group(group_id)
     
     group_params = {}
@@ -2216,7 +2367,7 @@ def update_assignment_group_helper(
 def delete_assignment_group_helper(course_id: int, group_id: int) -> dict:
     """Delete an assignment group."""
     canvas = get_canvas_client()
-    course = canvas.get_course(course_id)
+    course = get_course_ref(canvas, course_id)
     group = course.get_assignment_group(group_id)
     
     group_info = {
@@ -2235,590 +2386,594 @@ def delete_assignment_group_helper(course_id: int, group_id: int) -> dict:
 # -----------------------------
 # MCP TOOLS
 # -----------------------------
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="get_courses",
-            description="Get all Canvas courses for the authenticated user",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_upcoming_assignments",
-            description="Get assignments due in the next N days (default: 7). Assignments are sorted by priority score (higher priority = due sooner).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to look ahead for assignments",
-                        "default": 7
-                    }
+# Tool definitions never change, so build them once at import instead of on every
+# list_tools request.
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="get_courses",
+        description="Get all Canvas courses for the authenticated user",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_upcoming_assignments",
+        description="Get assignments due in the next N days (default: 7). Assignments are sorted by priority score (higher priority = due sooner).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to look ahead for assignments",
+                    "default": 7
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_daily_briefing",
+        description="Get a formatted daily briefing of upcoming assignments due in the next 7 days",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="create_assignment",
+        description="Create a new assignment in a Canvas course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course where the assignment will be created"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_daily_briefing",
-            description="Get a formatted daily briefing of upcoming assignments due in the next 7 days",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="create_assignment",
-            description="Create a new assignment in a Canvas course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course where the assignment will be created"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "The name/title of the assignment"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Assignment description (supports HTML)"
-                    },
-                    "due_at": {
-                        "type": "string",
-                        "description": "Due date in ISO 8601 format (e.g., '2025-12-31T23:59:00Z')"
-                    },
-                    "points_possible": {
-                        "type": "number",
-                        "description": "Maximum points for the assignment"
-                    },
-                    "submission_types": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        },
-                        "description": "List of submission types. Common options: 'online_upload', 'online_text_entry', 'online_url', 'on_paper', 'none'"
-                    },
-                    "published": {
-                        "type": "boolean",
-                        "description": "Whether to publish the assignment immediately (default: false)",
-                        "default": False
-                    }
+                "name": {
+                    "type": "string",
+                    "description": "The name/title of the assignment"
                 },
-                "required": ["course_id", "name"]
-            }
-        ),
-        Tool(
-            name="delete_assignment",
-            description="Delete an assignment from a Canvas course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course containing the assignment"
-                    },
-                    "assignment_id": {
-                        "type": "integer",
-                        "description": "The ID of the assignment to delete"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Assignment description (supports HTML)"
                 },
-                "required": ["course_id", "assignment_id"]
-            }
-        ),
-        Tool(
-            name="create_course",
-            description="Create a new Canvas course. Note: Requires appropriate permissions (typically admin or account admin).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Course name (required)"
-                    },
-                    "course_code": {
-                        "type": "string",
-                        "description": "Course code (optional)"
-                    },
-                    "start_at": {
-                        "type": "string",
-                        "description": "Course start date in ISO 8601 format (e.g., '2025-01-01T00:00:00Z')"
-                    },
-                    "end_at": {
-                        "type": "string",
-                        "description": "Course end date in ISO 8601 format (e.g., '2025-12-31T23:59:59Z')"
-                    },
-                    "license": {
-                        "type": "string",
-                        "description": "Course license (optional)"
-                    },
-                    "is_public": {
-                        "type": "boolean",
-                        "description": "Whether the course is public (default: false)",
-                        "default": False
-                    },
-                    "is_public_to_auth_users": {
-                        "type": "boolean",
-                        "description": "Whether the course is public to authenticated users (default: false)",
-                        "default": False
-                    },
-                    "public_syllabus": {
-                        "type": "boolean",
-                        "description": "Whether the syllabus is public (default: false)",
-                        "default": False
-                    },
-                    "public_syllabus_to_auth": {
-                        "type": "boolean",
-                        "description": "Whether the syllabus is public to authenticated users (default: false)",
-                        "default": False
-                    },
-                    "public_description": {
-                        "type": "string",
-                        "description": "Public course description (optional)"
-                    },
-                    "account_id": {
-                        "type": "integer",
-                        "description": "Account ID to create the course in (optional, defaults to user's account)"
-                    }
+                "due_at": {
+                    "type": "string",
+                    "description": "Due date in ISO 8601 format (e.g., '2025-12-31T23:59:00Z')"
                 },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="get_assignment_details",
-            description="Get detailed information about a specific assignment including description and rubric",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course containing the assignment"
+                "points_possible": {
+                    "type": "number",
+                    "description": "Maximum points for the assignment"
+                },
+                "submission_types": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     },
-                    "assignment_id": {
-                        "type": "integer",
-                        "description": "The ID of the assignment to retrieve"
-                    }
+                    "description": "List of submission types. Common options: 'online_upload', 'online_text_entry', 'online_url', 'on_paper', 'none'"
                 },
-                "required": ["course_id", "assignment_id"]
-            }
-        ),
-        Tool(
-            name="get_course_modules",
-            description="Get all modules and module items for a course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    }
+                "published": {
+                    "type": "boolean",
+                    "description": "Whether to publish the assignment immediately (default: false)",
+                    "default": False
+                }
+            },
+            "required": ["course_id", "name"]
+        }
+    ),
+    Tool(
+        name="delete_assignment",
+        description="Delete an assignment from a Canvas course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course containing the assignment"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="get_course_files",
-            description="Get all files for a course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    }
+                "assignment_id": {
+                    "type": "integer",
+                    "description": "The ID of the assignment to delete"
+                }
+            },
+            "required": ["course_id", "assignment_id"]
+        }
+    ),
+    Tool(
+        name="create_course",
+        description="Create a new Canvas course. Note: Requires appropriate permissions (typically admin or account admin).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Course name (required)"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="get_course_pages",
-            description="Get all pages for a course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    }
+                "course_code": {
+                    "type": "string",
+                    "description": "Course code (optional)"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="get_page_content",
-            description="Get the HTML/text content of a Canvas page",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    },
-                    "page_url": {
-                        "type": "string",
-                        "description": "The URL slug of the page (e.g., 'syllabus' or 'welcome')"
-                    }
+                "start_at": {
+                    "type": "string",
+                    "description": "Course start date in ISO 8601 format (e.g., '2025-01-01T00:00:00Z')"
                 },
-                "required": ["course_id", "page_url"]
-            }
-        ),
-        # Course Operations
-        Tool(
-            name="get_course",
-            description="Get a specific course by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {"type": "integer", "description": "The ID of the course"}
+                "end_at": {
+                    "type": "string",
+                    "description": "Course end date in ISO 8601 format (e.g., '2025-12-31T23:59:59Z')"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="update_course",
-            description="Update a course's properties",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {"type": "integer", "description": "The ID of the course"},
-                    "name": {"type": "string", "description": "New course name"},
-                    "course_code": {"type": "string", "description": "New course code"},
-                    "start_at": {"type": "string", "description": "Start date in ISO 8601 format"},
-                    "end_at": {"type": "string", "description": "End date in ISO 8601 format"}
+                "license": {
+                    "type": "string",
+                    "description": "Course license (optional)"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="delete_course",
-            description="Delete a course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {"type": "integer", "description": "The ID of the course to delete"}
+                "is_public": {
+                    "type": "boolean",
+                    "description": "Whether the course is public (default: false)",
+                    "default": False
                 },
-                "required": ["course_id"]
-            }
-        ),
-        # Assignment Operations
-        Tool(
-            name="get_assignment",
-            description="Get a specific assignment by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {"type": "integer", "description": "The ID of the course"},
-                    "assignment_id": {"type": "integer", "description": "The ID of the assignment"}
+                "is_public_to_auth_users": {
+                    "type": "boolean",
+                    "description": "Whether the course is public to authenticated users (default: false)",
+                    "default": False
                 },
-                "required": ["course_id", "assignment_id"]
-            }
-        ),
-        Tool(
-            name="update_assignment",
-            description="Update an assignment's properties",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {"type": "integer", "description": "The ID of the course"},
-                    "assignment_id": {"type": "integer", "description": "The ID of the assignment"},
-                    "name": {"type": "string", "description": "New assignment name"},
-                    "description": {"type": "string", "description": "New assignment description"},
-                    "due_at": {"type": "string", "description": "New due date in ISO 8601 format"},
-                    "points_possible": {"type": "number", "description": "New points possible"},
-                    "published": {"type": "boolean", "description": "Whether to publish the assignment"}
+                "public_syllabus": {
+                    "type": "boolean",
+                    "description": "Whether the syllabus is public (default: false)",
+                    "default": False
                 },
-                "required": ["course_id", "assignment_id"]
-            }
-        ),
-        # Submission Operations (5 tools)
-        Tool(name="create_submission", description="Create a submission for an assignment",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
-                "submission_type": {"type": "string"}, "body": {"type": "string"},
-                "url": {"type": "string"}, "file_ids": {"type": "array", "items": {"type": "integer"}},
-                "comment": {"type": "string"}}, "required": ["course_id", "assignment_id", "submission_type"]}),
-        Tool(name="get_submission", description="Get a specific submission",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
-                "user_id": {"type": "integer"}}, "required": ["course_id", "assignment_id", "user_id"]}),
-        Tool(name="list_submissions", description="List all submissions for an assignment",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"}},
-                "required": ["course_id", "assignment_id"]}),
-        Tool(name="update_submission", description="Update a submission (grade, comment, etc.)",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
-                "user_id": {"type": "integer"}, "grade": {"type": "string"},
-                "comment": {"type": "string"}, "excused": {"type": "boolean"}},
-                "required": ["course_id", "assignment_id", "user_id"]}),
-        Tool(name="delete_submission", description="Delete a submission",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
-                "user_id": {"type": "integer"}}, "required": ["course_id", "assignment_id", "user_id"]}),
-        # Quiz Operations (6 tools)
-        Tool(name="create_quiz", description="Create a new quiz",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "title": {"type": "string"},
-                "description": {"type": "string"}, "quiz_type": {"type": "string"},
-                "time_limit": {"type": "integer"}, "allowed_attempts": {"type": "integer"},
-                "due_at": {"type": "string"}, "published": {"type": "boolean"}},
-                "required": ["course_id", "title"]}),
-        Tool(name="get_quiz", description="Get a specific quiz",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
-                "required": ["course_id", "quiz_id"]}),
-        Tool(name="list_quizzes", description="List all quizzes for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="get_quiz_questions", description="Get questions for a quiz",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
-                "required": ["course_id", "quiz_id"]}),
-        Tool(name="update_quiz", description="Update a quiz",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
-                "title": {"type": "string"}, "description": {"type": "string"},
-                "due_at": {"type": "string"}, "published": {"type": "boolean"}},
-                "required": ["course_id", "quiz_id"]}),
-        Tool(name="delete_quiz", description="Delete a quiz",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
-                "required": ["course_id", "quiz_id"]}),
-        # Quiz Submission Operations (5 tools)
-        Tool(name="create_quiz_submission", description="Create/start a quiz submission",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
-                "access_code": {"type": "string"}}, "required": ["course_id", "quiz_id"]}),
-        Tool(name="get_quiz_submission", description="Get a specific quiz submission",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
-                "submission_id": {"type": "integer"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
-        Tool(name="list_quiz_submissions", description="List all quiz submissions",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
-                "required": ["course_id", "quiz_id"]}),
-        Tool(name="update_quiz_submission_score", description="Update quiz submission score",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
-                "submission_id": {"type": "integer"}, "fudge_points": {"type": "number"},
-                "comment": {"type": "string"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
-        Tool(name="delete_quiz_submission", description="Delete a quiz submission",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
-                "submission_id": {"type": "integer"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
-        # Discussion Operations (6 tools)
-        Tool(name="create_discussion", description="Create a new discussion topic",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "title": {"type": "string"},
-                "message": {"type": "string"}, "pinned": {"type": "boolean"},
-                "locked": {"type": "boolean"}}, "required": ["course_id", "title", "message"]}),
-        Tool(name="get_discussion", description="Get a specific discussion",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
-                "required": ["course_id", "topic_id"]}),
-        Tool(name="list_discussions", description="List all discussions for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="get_discussion_entries", description="Get entries/posts for a discussion",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
-                "required": ["course_id", "topic_id"]}),
-        Tool(name="update_discussion", description="Update a discussion topic",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"},
-                "title": {"type": "string"}, "message": {"type": "string"},
-                "pinned": {"type": "boolean"}, "locked": {"type": "boolean"}},
-                "required": ["course_id", "topic_id"]}),
-        Tool(name="delete_discussion", description="Delete a discussion topic",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
-                "required": ["course_id", "topic_id"]}),
-        # Announcement Operations (5 tools)
-        Tool(name="create_announcement", description="Create a new announcement",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "title": {"type": "string"},
-                "message": {"type": "string"}, "delayed_post_at": {"type": "string"}},
-                "required": ["course_id", "title", "message"]}),
-        Tool(name="get_announcement", description="Get a specific announcement",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
-                "required": ["course_id", "topic_id"]}),
-        Tool(name="list_announcements", description="List all announcements for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="update_announcement", description="Update an announcement",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"},
-                "title": {"type": "string"}, "message": {"type": "string"}},
-                "required": ["course_id", "topic_id"]}),
-        Tool(name="delete_announcement", description="Delete an announcement",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
-                "required": ["course_id", "topic_id"]}),
-        # Conversation/Message Operations (5 tools)
-        Tool(name="send_message", description="Send a message to users",
-            inputSchema={"type": "object", "properties": {
-                "recipient_ids": {"type": "array", "items": {"type": "integer"}},
-                "body": {"type": "string"}, "subject": {"type": "string"},
-                "group_conversation": {"type": "boolean"}}, "required": ["recipient_ids", "body"]}),
-        Tool(name="get_conversation", description="Get a specific conversation",
-            inputSchema={"type": "object", "properties": {"conversation_id": {"type": "integer"}},
-                "required": ["conversation_id"]}),
-        Tool(name="list_conversations", description="List all conversations for current user",
-            inputSchema={"type": "object", "properties": {}, "required": []}),
-        Tool(name="update_conversation", description="Update a conversation (mark read/unread, archive, star)",
-            inputSchema={"type": "object", "properties": {
-                "conversation_id": {"type": "integer"}, "workflow_state": {"type": "string"},
-                "starred": {"type": "boolean"}}, "required": ["conversation_id"]}),
-        Tool(name="delete_conversation", description="Delete a conversation",
-            inputSchema={"type": "object", "properties": {"conversation_id": {"type": "integer"}},
-                "required": ["conversation_id"]}),
-        # Module Operations (6 tools)
-        Tool(name="create_module", description="Create a new module",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "name": {"type": "string"},
-                "position": {"type": "integer"}, "unlock_at": {"type": "string"},
-                "require_sequential_progress": {"type": "boolean"}}, "required": ["course_id", "name"]}),
-        Tool(name="get_module", description="Get a specific module",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
-                "required": ["course_id", "module_id"]}),
-        Tool(name="list_modules", description="List all modules for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="get_module_items", description="Get items in a module",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
-                "required": ["course_id", "module_id"]}),
-        Tool(name="update_module", description="Update a module",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
-                "name": {"type": "string"}, "position": {"type": "integer"},
-                "unlock_at": {"type": "string"}}, "required": ["course_id", "module_id"]}),
-        Tool(name="delete_module", description="Delete a module",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
-                "required": ["course_id", "module_id"]}),
-        # Module Item Operations (5 tools)
-        Tool(name="create_module_item", description="Create a new module item",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
-                "type": {"type": "string"}, "content_id": {"type": "integer"},
-                "title": {"type": "string"}, "position": {"type": "integer"},
-                "page_url": {"type": "string"}, "external_url": {"type": "string"}},
-                "required": ["course_id", "module_id", "type"]}),
-        Tool(name="get_module_item", description="Get a specific module item",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
-                "item_id": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
-        Tool(name="update_module_item", description="Update a module item",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
-                "item_id": {"type": "integer"}, "title": {"type": "string"},
-                "position": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
-        Tool(name="delete_module_item", description="Delete a module item",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
-                "item_id": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
-        # Page Operations (5 tools)
-        Tool(name="create_page", description="Create a new wiki page",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "title": {"type": "string"},
-                "body": {"type": "string"}, "editing_roles": {"type": "string"},
-                "published": {"type": "boolean"}, "front_page": {"type": "boolean"}},
-                "required": ["course_id", "title", "body"]}),
-        Tool(name="get_page", description="Get a specific page by URL",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "url": {"type": "string"}},
-                "required": ["course_id", "url"]}),
-        Tool(name="list_pages", description="List all pages for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="update_page", description="Update a page",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "url": {"type": "string"},
-                "title": {"type": "string"}, "body": {"type": "string"},
-                "published": {"type": "boolean"}, "front_page": {"type": "boolean"}},
-                "required": ["course_id", "url"]}),
-        Tool(name="delete_page", description="Delete a page",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "url": {"type": "string"}},
-                "required": ["course_id", "url"]}),
-        # File Operations (5 tools)
-        Tool(name="upload_file", description="Upload a file to a course",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "file_path": {"type": "string"},
-                "folder_id": {"type": "integer"}, "on_duplicate": {"type": "string"}},
-                "required": ["course_id", "file_path"]}),
-        Tool(name="get_file", description="Get a specific file",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "file_id": {"type": "integer"}},
-                "required": ["course_id", "file_id"]}),
-        Tool(name="list_files", description="List files for a course",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "folder_id": {"type": "integer"},
-                "search_term": {"type": "string"}}, "required": ["course_id"]}),
-        Tool(name="update_file", description="Update a file (rename, lock, hide)",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "file_id": {"type": "integer"},
-                "name": {"type": "string"}, "locked": {"type": "boolean"},
-                "hidden": {"type": "boolean"}}, "required": ["course_id", "file_id"]}),
-        Tool(name="delete_file", description="Delete a file",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "file_id": {"type": "integer"}},
-                "required": ["course_id", "file_id"]}),
-        # Folder Operations (5 tools)
-        Tool(name="create_folder", description="Create a new folder",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "name": {"type": "string"},
-                "parent_folder_id": {"type": "integer"}, "locked": {"type": "boolean"},
-                "hidden": {"type": "boolean"}}, "required": ["course_id", "name"]}),
-        Tool(name="get_folder", description="Get a specific folder",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
-                "required": ["course_id", "folder_id"]}),
-        Tool(name="list_folders", description="List folders for a course",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="update_folder", description="Update a folder",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "folder_id": {"type": "integer"},
-                "name": {"type": "string"}, "locked": {"type": "boolean"},
-                "hidden": {"type": "boolean"}}, "required": ["course_id", "folder_id"]}),
-        Tool(name="delete_folder", description="Delete a folder",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
-                "required": ["course_id", "folder_id"]}),
-        # Assignment Group Operations (5 tools)
-        Tool(name="create_assignment_group", description="Create a new assignment group",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "name": {"type": "string"},
-                "position": {"type": "integer"}, "group_weight": {"type": "number"}},
-                "required": ["course_id", "name"]}),
-        Tool(name="get_assignment_group", description="Get a specific assignment group",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "group_id": {"type": "integer"}},
-                "required": ["course_id", "group_id"]}),
-        Tool(name="list_assignment_groups", description="List all assignment groups for a course",
-            inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
-                "required": ["course_id"]}),
-        Tool(name="update_assignment_group", description="Update an assignment group",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "group_id": {"type": "integer"},
-                "name": {"type": "string"}, "position": {"type": "integer"},
-                "group_weight": {"type": "number"}}, "required": ["course_id", "group_id"]}),
-        Tool(name="delete_assignment_group", description="Delete an assignment group",
-            inputSchema={"type": "object", "properties": {
-                "course_id": {"type": "integer"}, "group_id": {"type": "integer"}},
-                "required": ["course_id", "group_id"]})
-    ]
+                "public_syllabus_to_auth": {
+                    "type": "boolean",
+                    "description": "Whether the syllabus is public to authenticated users (default: false)",
+                    "default": False
+                },
+                "public_description": {
+                    "type": "string",
+                    "description": "Public course description (optional)"
+                },
+                "account_id": {
+                    "type": "integer",
+                    "description": "Account ID to create the course in (optional, defaults to user's account)"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="get_assignment_details",
+        description="Get detailed information about a specific assignment including description and rubric",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course containing the assignment"
+                },
+                "assignment_id": {
+                    "type": "integer",
+                    "description": "The ID of the assignment to retrieve"
+                }
+            },
+            "required": ["course_id", "assignment_id"]
+        }
+    ),
+    Tool(
+        name="get_course_modules",
+        description="Get all modules and module items for a course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
+                }
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="get_course_files",
+        description="Get all files for a course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
+                }
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="get_course_pages",
+        description="Get all pages for a course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
+                }
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="get_page_content",
+        description="Get the HTML/text content of a Canvas page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
+                },
+                "page_url": {
+                    "type": "string",
+                    "description": "The URL slug of the page (e.g., 'syllabus' or 'welcome')"
+                }
+            },
+            "required": ["course_id", "page_url"]
+        }
+    ),
+    # Course Operations
+    Tool(
+        name="get_course",
+        description="Get a specific course by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The ID of the course"}
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="update_course",
+        description="Update a course's properties",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The ID of the course"},
+                "name": {"type": "string", "description": "New course name"},
+                "course_code": {"type": "string", "description": "New course code"},
+                "start_at": {"type": "string", "description": "Start date in ISO 8601 format"},
+                "end_at": {"type": "string", "description": "End date in ISO 8601 format"}
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="delete_course",
+        description="Delete a course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The ID of the course to delete"}
+            },
+            "required": ["course_id"]
+        }
+    ),
+    # Assignment Operations
+    Tool(
+        name="get_assignment",
+        description="Get a specific assignment by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The ID of the course"},
+                "assignment_id": {"type": "integer", "description": "The ID of the assignment"}
+            },
+            "required": ["course_id", "assignment_id"]
+        }
+    ),
+    Tool(
+        name="update_assignment",
+        description="Update an assignment's properties",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The ID of the course"},
+                "assignment_id": {"type": "integer", "description": "The ID of the assignment"},
+                "name": {"type": "string", "description": "New assignment name"},
+                "description": {"type": "string", "description": "New assignment description"},
+                "due_at": {"type": "string", "description": "New due date in ISO 8601 format"},
+                "points_possible": {"type": "number", "description": "New points possible"},
+                "published": {"type": "boolean", "description": "Whether to publish the assignment"}
+            },
+            "required": ["course_id", "assignment_id"]
+        }
+    ),
+    # Submission Operations (5 tools)
+    Tool(name="create_submission", description="Create a submission for an assignment",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
+            "submission_type": {"type": "string"}, "body": {"type": "string"},
+            "url": {"type": "string"}, "file_ids": {"type": "array", "items": {"type": "integer"}},
+            "comment": {"type": "string"}}, "required": ["course_id", "assignment_id", "submission_type"]}),
+    Tool(name="get_submission", description="Get a specific submission",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
+            "user_id": {"type": "integer"}}, "required": ["course_id", "assignment_id", "user_id"]}),
+    Tool(name="list_submissions", description="List all submissions for an assignment",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"}},
+            "required": ["course_id", "assignment_id"]}),
+    Tool(name="update_submission", description="Update a submission (grade, comment, etc.)",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
+            "user_id": {"type": "integer"}, "grade": {"type": "string"},
+            "comment": {"type": "string"}, "excused": {"type": "boolean"}},
+            "required": ["course_id", "assignment_id", "user_id"]}),
+    Tool(name="delete_submission", description="Delete a submission",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "assignment_id": {"type": "integer"},
+            "user_id": {"type": "integer"}}, "required": ["course_id", "assignment_id", "user_id"]}),
+    # Quiz Operations (6 tools)
+    Tool(name="create_quiz", description="Create a new quiz",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "title": {"type": "string"},
+            "description": {"type": "string"}, "quiz_type": {"type": "string"},
+            "time_limit": {"type": "integer"}, "allowed_attempts": {"type": "integer"},
+            "due_at": {"type": "string"}, "published": {"type": "boolean"}},
+            "required": ["course_id", "title"]}),
+    Tool(name="get_quiz", description="Get a specific quiz",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
+            "required": ["course_id", "quiz_id"]}),
+    Tool(name="list_quizzes", description="List all quizzes for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="get_quiz_questions", description="Get questions for a quiz",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
+            "required": ["course_id", "quiz_id"]}),
+    Tool(name="update_quiz", description="Update a quiz",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
+            "title": {"type": "string"}, "description": {"type": "string"},
+            "due_at": {"type": "string"}, "published": {"type": "boolean"}},
+            "required": ["course_id", "quiz_id"]}),
+    Tool(name="delete_quiz", description="Delete a quiz",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
+            "required": ["course_id", "quiz_id"]}),
+    # Quiz Submission Operations (5 tools)
+    Tool(name="create_quiz_submission", description="Create/start a quiz submission",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
+            "access_code": {"type": "string"}}, "required": ["course_id", "quiz_id"]}),
+    Tool(name="get_quiz_submission", description="Get a specific quiz submission",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
+            "submission_id": {"type": "integer"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
+    Tool(name="list_quiz_submissions", description="List all quiz submissions",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"}},
+            "required": ["course_id", "quiz_id"]}),
+    Tool(name="update_quiz_submission_score", description="Update quiz submission score",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
+            "submission_id": {"type": "integer"}, "fudge_points": {"type": "number"},
+            "comment": {"type": "string"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
+    Tool(name="delete_quiz_submission", description="Delete a quiz submission",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "quiz_id": {"type": "integer"},
+            "submission_id": {"type": "integer"}}, "required": ["course_id", "quiz_id", "submission_id"]}),
+    # Discussion Operations (6 tools)
+    Tool(name="create_discussion", description="Create a new discussion topic",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "title": {"type": "string"},
+            "message": {"type": "string"}, "pinned": {"type": "boolean"},
+            "locked": {"type": "boolean"}}, "required": ["course_id", "title", "message"]}),
+    Tool(name="get_discussion", description="Get a specific discussion",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
+            "required": ["course_id", "topic_id"]}),
+    Tool(name="list_discussions", description="List all discussions for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="get_discussion_entries", description="Get entries/posts for a discussion",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
+            "required": ["course_id", "topic_id"]}),
+    Tool(name="update_discussion", description="Update a discussion topic",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"},
+            "title": {"type": "string"}, "message": {"type": "string"},
+            "pinned": {"type": "boolean"}, "locked": {"type": "boolean"}},
+            "required": ["course_id", "topic_id"]}),
+    Tool(name="delete_discussion", description="Delete a discussion topic",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
+            "required": ["course_id", "topic_id"]}),
+    # Announcement Operations (5 tools)
+    Tool(name="create_announcement", description="Create a new announcement",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "title": {"type": "string"},
+            "message": {"type": "string"}, "delayed_post_at": {"type": "string"}},
+            "required": ["course_id", "title", "message"]}),
+    Tool(name="get_announcement", description="Get a specific announcement",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
+            "required": ["course_id", "topic_id"]}),
+    Tool(name="list_announcements", description="List all announcements for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="update_announcement", description="Update an announcement",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"},
+            "title": {"type": "string"}, "message": {"type": "string"}},
+            "required": ["course_id", "topic_id"]}),
+    Tool(name="delete_announcement", description="Delete an announcement",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "topic_id": {"type": "integer"}},
+            "required": ["course_id", "topic_id"]}),
+    # Conversation/Message Operations (5 tools)
+    Tool(name="send_message", description="Send a message to users",
+        inputSchema={"type": "object", "properties": {
+            "recipient_ids": {"type": "array", "items": {"type": "integer"}},
+            "body": {"type": "string"}, "subject": {"type": "string"},
+            "group_conversation": {"type": "boolean"}}, "required": ["recipient_ids", "body"]}),
+    Tool(name="get_conversation", description="Get a specific conversation",
+        inputSchema={"type": "object", "properties": {"conversation_id": {"type": "integer"}},
+            "required": ["conversation_id"]}),
+    Tool(name="list_conversations", description="List all conversations for current user",
+        inputSchema={"type": "object", "properties": {}, "required": []}),
+    Tool(name="update_conversation", description="Update a conversation (mark read/unread, archive, star)",
+        inputSchema={"type": "object", "properties": {
+            "conversation_id": {"type": "integer"}, "workflow_state": {"type": "string"},
+            "starred": {"type": "boolean"}}, "required": ["conversation_id"]}),
+    Tool(name="delete_conversation", description="Delete a conversation",
+        inputSchema={"type": "object", "properties": {"conversation_id": {"type": "integer"}},
+            "required": ["conversation_id"]}),
+    # Module Operations (6 tools)
+    Tool(name="create_module", description="Create a new module",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "name": {"type": "string"},
+            "position": {"type": "integer"}, "unlock_at": {"type": "string"},
+            "require_sequential_progress": {"type": "boolean"}}, "required": ["course_id", "name"]}),
+    Tool(name="get_module", description="Get a specific module",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
+            "required": ["course_id", "module_id"]}),
+    Tool(name="list_modules", description="List all modules for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="get_module_items", description="Get items in a module",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
+            "required": ["course_id", "module_id"]}),
+    Tool(name="update_module", description="Update a module",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
+            "name": {"type": "string"}, "position": {"type": "integer"},
+            "unlock_at": {"type": "string"}}, "required": ["course_id", "module_id"]}),
+    Tool(name="delete_module", description="Delete a module",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"}},
+            "required": ["course_id", "module_id"]}),
+    # Module Item Operations (5 tools)
+    Tool(name="create_module_item", description="Create a new module item",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
+            "type": {"type": "string"}, "content_id": {"type": "integer"},
+            "title": {"type": "string"}, "position": {"type": "integer"},
+            "page_url": {"type": "string"}, "external_url": {"type": "string"}},
+            "required": ["course_id", "module_id", "type"]}),
+    Tool(name="get_module_item", description="Get a specific module item",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
+            "item_id": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
+    Tool(name="update_module_item", description="Update a module item",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
+            "item_id": {"type": "integer"}, "title": {"type": "string"},
+            "position": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
+    Tool(name="delete_module_item", description="Delete a module item",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "module_id": {"type": "integer"},
+            "item_id": {"type": "integer"}}, "required": ["course_id", "module_id", "item_id"]}),
+    # Page Operations (5 tools)
+    Tool(name="create_page", description="Create a new wiki page",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "title": {"type": "string"},
+            "body": {"type": "string"}, "editing_roles": {"type": "string"},
+            "published": {"type": "boolean"}, "front_page": {"type": "boolean"}},
+            "required": ["course_id", "title", "body"]}),
+    Tool(name="get_page", description="Get a specific page by URL",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "url": {"type": "string"}},
+            "required": ["course_id", "url"]}),
+    Tool(name="list_pages", description="List all pages for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="update_page", description="Update a page",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "url": {"type": "string"},
+            "title": {"type": "string"}, "body": {"type": "string"},
+            "published": {"type": "boolean"}, "front_page": {"type": "boolean"}},
+            "required": ["course_id", "url"]}),
+    Tool(name="delete_page", description="Delete a page",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "url": {"type": "string"}},
+            "required": ["course_id", "url"]}),
+    # File Operations (5 tools)
+    Tool(name="upload_file", description="Upload a file to a course",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "file_path": {"type": "string"},
+            "folder_id": {"type": "integer"}, "on_duplicate": {"type": "string"}},
+            "required": ["course_id", "file_path"]}),
+    Tool(name="get_file", description="Get a specific file",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "file_id": {"type": "integer"}},
+            "required": ["course_id", "file_id"]}),
+    Tool(name="list_files", description="List files for a course",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "folder_id": {"type": "integer"},
+            "search_term": {"type": "string"}}, "required": ["course_id"]}),
+    Tool(name="update_file", description="Update a file (rename, lock, hide)",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "file_id": {"type": "integer"},
+            "name": {"type": "string"}, "locked": {"type": "boolean"},
+            "hidden": {"type": "boolean"}}, "required": ["course_id", "file_id"]}),
+    Tool(name="delete_file", description="Delete a file",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "file_id": {"type": "integer"}},
+            "required": ["course_id", "file_id"]}),
+    # Folder Operations (5 tools)
+    Tool(name="create_folder", description="Create a new folder",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "name": {"type": "string"},
+            "parent_folder_id": {"type": "integer"}, "locked": {"type": "boolean"},
+            "hidden": {"type": "boolean"}}, "required": ["course_id", "name"]}),
+    Tool(name="get_folder", description="Get a specific folder",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
+            "required": ["course_id", "folder_id"]}),
+    Tool(name="list_folders", description="List folders for a course",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="update_folder", description="Update a folder",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "folder_id": {"type": "integer"},
+            "name": {"type": "string"}, "locked": {"type": "boolean"},
+            "hidden": {"type": "boolean"}}, "required": ["course_id", "folder_id"]}),
+    Tool(name="delete_folder", description="Delete a folder",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "folder_id": {"type": "integer"}},
+            "required": ["course_id", "folder_id"]}),
+    # Assignment Group Operations (5 tools)
+    Tool(name="create_assignment_group", description="Create a new assignment group",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "name": {"type": "string"},
+            "position": {"type": "integer"}, "group_weight": {"type": "number"}},
+            "required": ["course_id", "name"]}),
+    Tool(name="get_assignment_group", description="Get a specific assignment group",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "group_id": {"type": "integer"}},
+            "required": ["course_id", "group_id"]}),
+    Tool(name="list_assignment_groups", description="List all assignment groups for a course",
+        inputSchema={"type": "object", "properties": {"course_id": {"type": "integer"}},
+            "required": ["course_id"]}),
+    Tool(name="update_assignment_group", description="Update an assignment group",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "group_id": {"type": "integer"},
+            "name": {"type": "string"}, "position": {"type": "integer"},
+            "group_weight": {"type": "number"}}, "required": ["course_id", "group_id"]}),
+    Tool(name="delete_assignment_group", description="Delete an assignment group",
+        inputSchema={"type": "object", "properties": {
+            "course_id": {"type": "integer"}, "group_id": {"type": "integer"}},
+            "required": ["course_id", "group_id"]})
+)
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return list(_TOOLS)
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[TextContent]:
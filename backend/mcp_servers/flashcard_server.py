@@ -3,7 +3,7 @@ Flashcard MCP Server for creating, managing, and reviewing flashcards.
 """
 import os
 import asyncio
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -34,183 +34,187 @@ def generate_flashcards_from_content(
 # -----------------------------
 # MCP TOOLS
 # -----------------------------
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="create_flashcard_set",
-            description="Create a new flashcard set for a course, optionally linked to an assignment",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    },
-                    "course_name": {
-                        "type": "string",
-                        "description": "The name of the course"
-                    },
-                    "assignment_id": {
-                        "type": "integer",
-                        "description": "Optional: The ID of the assignment this flashcard set is for"
-                    },
-                    "assignment_name": {
-                        "type": "string",
-                        "description": "Optional: The name of the assignment"
-                    },
-                    "notes": {
-                        "type": "string",
-                        "description": "Optional: Student notes to include in flashcard generation"
-                    }
+# Tool definitions never change, so build them once at import instead of on every
+# list_tools request.
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="create_flashcard_set",
+        description="Create a new flashcard set for a course, optionally linked to an assignment",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
                 },
-                "required": ["course_id", "course_name"]
-            }
-        ),
-        Tool(
-            name="add_flashcards_to_set",
-            description="Add flashcards to an existing flashcard set. Flashcards should be provided as a list of objects with 'question' and 'answer' fields.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set"
-                    },
-                    "flashcards": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "question": {
-                                    "type": "string",
-                                    "description": "The question/front of the flashcard"
-                                },
-                                "answer": {
-                                    "type": "string",
-                                    "description": "The answer/back of the flashcard"
-                                },
-                                "tags": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "description": "Optional tags for categorizing the flashcard"
-                                }
-                            },
-                            "required": ["question", "answer"]
-                        },
-                        "description": "List of flashcards to add"
-                    }
+                "course_name": {
+                    "type": "string",
+                    "description": "The name of the course"
                 },
-                "required": ["set_id", "flashcards"]
-            }
-        ),
-        Tool(
-            name="get_flashcard_set",
-            description="Get a flashcard set by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set"
-                    }
+                "assignment_id": {
+                    "type": "integer",
+                    "description": "Optional: The ID of the assignment this flashcard set is for"
                 },
-                "required": ["set_id"]
-            }
-        ),
-        Tool(
-            name="get_flashcard_sets_by_course",
-            description="Get all flashcard sets for a specific course",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "course_id": {
-                        "type": "integer",
-                        "description": "The ID of the course"
-                    }
+                "assignment_name": {
+                    "type": "string",
+                    "description": "Optional: The name of the assignment"
                 },
-                "required": ["course_id"]
-            }
-        ),
-        Tool(
-            name="get_flashcards_needing_review",
-            description="Get flashcards that need review (not mastered)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of flashcards to return (optional)"
-                    }
+                "notes": {
+                    "type": "string",
+                    "description": "Optional: Student notes to include in flashcard generation"
+                }
+            },
+            "required": ["course_id", "course_name"]
+        }
+    ),
+    Tool(
+        name="add_flashcards_to_set",
+        description="Add flashcards to an existing flashcard set. Flashcards should be provided as a list of objects with 'question' and 'answer' fields.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set"
                 },
-                "required": ["set_id"]
-            }
-        ),
-        Tool(
-            name="record_flashcard_review",
-            description="Record a flashcard review (correct or incorrect)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set"
-                    },
-                    "flashcard_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard"
+                "flashcards": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "question": {
+                                "type": "string",
+                                "description": "The question/front of the flashcard"
+                            },
+                            "answer": {
+                                "type": "string",
+                                "description": "The answer/back of the flashcard"
+                            },
+                            "tags": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Optional tags for categorizing the flashcard"
+                            }
+                        },
+                        "required": ["question", "answer"]
                     },
-                    "correct": {
-                        "type": "boolean",
-                        "description": "Whether the student got the flashcard correct"
-                    }
+                    "description": "List of flashcards to add"
+                }
+            },
+            "required": ["set_id", "flashcards"]
+        }
+    ),
+    Tool(
+        name="get_flashcard_set",
+        description="Get a flashcard set by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set"
+                }
+            },
+            "required": ["set_id"]
+        }
+    ),
+    Tool(
+        name="get_flashcard_sets_by_course",
+        description="Get all flashcard sets for a specific course",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "course_id": {
+                    "type": "integer",
+                    "description": "The ID of the course"
+                }
+            },
+            "required": ["course_id"]
+        }
+    ),
+    Tool(
+        name="get_flashcards_needing_review",
+        description="Get flashcards that need review (not mastered)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set"
                 },
-                "required": ["set_id", "flashcard_id", "correct"]
-            }
-        ),
-        Tool(
-            name="get_flashcard_progress",
-            description="Get progress statistics for a flashcard set",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of flashcards to return (optional)"
+                }
+            },
+            "required": ["set_id"]
+        }
+    ),
+    Tool(
+        name="record_flashcard_review",
+        description="Record a flashcard review (correct or incorrect)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set"
                 },
-                "required": ["set_id"]
-            }
-        ),
-        Tool(
-            name="get_all_flashcard_sets",
-            description="Get all flashcard sets",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="delete_flashcard_set",
-            description="Delete a flashcard set",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "set_id": {
-                        "type": "string",
-                        "description": "The ID of the flashcard set to delete"
-                    }
+                "flashcard_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard"
                 },
-                "required": ["set_id"]
-            }
-        )
-    ]
+                "correct": {
+                    "type": "boolean",
+                    "description": "Whether the student got the flashcard correct"
+                }
+            },
+            "required": ["set_id", "flashcard_id", "correct"]
+        }
+    ),
+    Tool(
+        name="get_flashcard_progress",
+        description="Get progress statistics for a flashcard set",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set"
+                }
+            },
+            "required": ["set_id"]
+        }
+    ),
+    Tool(
+        name="get_all_flashcard_sets",
+        description="Get all flashcard sets",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="delete_flashcard_set",
+        description="Delete a flashcard set",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "set_id": {
+                    "type": "string",
+                    "description": "The ID of the flashcard set to delete"
+                }
+            },
+            "required": ["set_id"]
+        }
+    )
+)
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return list(_TOOLS)
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[TextContent]:
@@ -8,7 +8,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from datetime import datetime, timedelta, timezone
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -18,7 +18,6 @@ try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
 except ImportError:
     raise ImportError(
@@ -26,6 +25,9 @@ except ImportError:
         "pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
     )
 
+from backend.utils.cache import TTLCache
+from backend.utils.google_http import build_service
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
@@ -34,6 +36,10 @@ SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 # Global Gmail service (initialized lazily)
 _gmail_service: Any = None
 
+# Per-user Gmail services, keyed by refresh token. The credentials refresh
+# their own access token, so a cached service stays usable.
+_user_services = TTLCache(max_entries=64, default_ttl=3600.0)
+
 # -----------------------------
 # AUTHENTICATION
 # -----------------------------
@@ -44,8 +50,14 @@ def get_gmail_service(credentials: Optional[Dict[str, Any]] = None):
         credentials: Optional credentials dictionary from Supabase. If provided, uses these
                      instead of file-based credentials.
     """
-    # If credentials are provided, use them directly (don't cache globally for per-user auth)
+    # If credentials are provided, use a per-user service keyed by refresh token, so
+    # a user's calls reuse one discovery document and HTTP connection
     if credentials:
+        cache_key = credentials.get("refresh_token")
+        service = _user_services.get(cache_key) if cache_key else None
+        if service is not None:
+            return service
+        
         try:
             creds = Credentials.from_authorized_user_info(credentials, SCOPES)
             
@@ -54,12 +66,16 @@ def get_gmail_service(credentials: Optional[Dict[str, Any]] = None):
                 creds.refresh(Request())
             
             # Build service with these credentials
-            return build('gmail', 'v1', credentials=creds)
+            service = build_service('gmail', 'v1', creds)
         except Exception as e:
             raise ValueError(
                 f"Failed to initialize Gmail service with provided credentials: {str(e)}. "
                 "Please check your credentials are valid."
             )
+        
+        if cache_key:
+            _user_services.set(cache_key, service)
+        return service
     
     # Otherwise, use file-based authentication (existing behavior)
     global _gmail_service
@@ -104,7 +120,7 @@ def get_gmail_service(credentials: Optional[Dict[str, Any]] = None):
     
     # Build the Gmail service
     try:
-        _gmail_service = build('gmail', 'v1', credentials=creds)
+        _gmail_service = build_service('gmail', 'v1', creds)
         return _gmail_service
     except Exception as e:
         raise ValueError(
@@ -172,6 +188,27 @@ def get_message(message_id: str, user_id: str = 'me', format: str = 'full', cred
     except HttpError as error:
         raise Exception(f"An error occurred while getting message: {error}")
 
+def get_parsed_message_or_none(message_id: str, user_id: str = 'me', credentials: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get and parse a message by ID, returning None instead of raising on failure.
+    
+    Used by the list/search loops so a single bad message (one that cannot be
+    fetched, or that parse_message cannot handle) is filtered out without
+    wrapping every iteration in its own try/except.
+    
+    Args:
+        message_id: The ID of the message
+        user_id: User's email address or 'me' for authenticated user
+        credentials: Optional credentials dictionary from Supabase
+    
+    Returns:
+        Parsed message dictionary (see parse_message), or None on failure
+    """
+    try:
+        return parse_message(get_message(message_id, user_id=user_id, credentials=credentials))
+    except Exception:
+        return None
+
 def parse_message(message: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse a Gmail message into a readable format.
@@ -335,174 +372,178 @@ def delete_message(message_id: str, user_id: str = 'me', credentials: Optional[D
 # -----------------------------
 # MCP TOOLS
 # -----------------------------
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="list_emails",
-            description="List emails from Gmail with optional filtering. Supports Gmail search queries.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Gmail search query (e.g., 'is:unread', 'from:example@gmail.com', 'subject:test', 'has:attachment'). Leave empty for all emails.",
-                        "default": ""
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of emails to return (default: 10, max: 500)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 500
-                    }
+# Tool definitions never change, so build them once at import instead of on every
+# list_tools request.
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="list_emails",
+        description="List emails from Gmail with optional filtering. Supports Gmail search queries.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Gmail search query (e.g., 'is:unread', 'from:example@gmail.com', 'subject:test', 'has:attachment'). Leave empty for all emails.",
+                    "default": ""
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_email",
-            description="Get detailed information about a specific email by message ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "The ID of the email message to retrieve"
-                    }
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails to return (default: 10, max: 500)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 500
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_email",
+        description="Get detailed information about a specific email by message ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {
+                    "type": "string",
+                    "description": "The ID of the email message to retrieve"
+                }
+            },
+            "required": ["message_id"]
+        }
+    ),
+    Tool(
+        name="send_email",
+        description="Send an email through Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address"
+                },
+                "subject": {
+                    "type": "string",
+                    "description": "Email subject"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Email body content"
+                },
+                "body_type": {
+                    "type": "string",
+                    "description": "Body type: 'plain' or 'html' (default: 'plain')",
+                    "enum": ["plain", "html"],
+                    "default": "plain"
+                },
+                "cc": {
+                    "type": "string",
+                    "description": "CC email address (optional)"
                 },
-                "required": ["message_id"]
-            }
-        ),
-        Tool(
-            name="send_email",
-            description="Send an email through Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "to": {
-                        "type": "string",
-                        "description": "Recipient email address"
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Email subject"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Email body content"
-                    },
-                    "body_type": {
-                        "type": "string",
-                        "description": "Body type: 'plain' or 'html' (default: 'plain')",
-                        "enum": ["plain", "html"],
-                        "default": "plain"
-                    },
-                    "cc": {
-                        "type": "string",
-                        "description": "CC email address (optional)"
-                    },
-                    "bcc": {
-                        "type": "string",
-                        "description": "BCC email address (optional)"
-                    }
+                "bcc": {
+                    "type": "string",
+                    "description": "BCC email address (optional)"
+                }
+            },
+            "required": ["to", "subject", "body"]
+        }
+    ),
+    Tool(
+        name="mark_email_read",
+        description="Mark an email as read",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {
+                    "type": "string",
+                    "description": "The ID of the email message to mark as read"
+                }
+            },
+            "required": ["message_id"]
+        }
+    ),
+    Tool(
+        name="mark_email_unread",
+        description="Mark an email as unread",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {
+                    "type": "string",
+                    "description": "The ID of the email message to mark as unread"
+                }
+            },
+            "required": ["message_id"]
+        }
+    ),
+    Tool(
+        name="delete_email",
+        description="Delete an email from Gmail",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message_id": {
+                    "type": "string",
+                    "description": "The ID of the email message to delete"
+                }
+            },
+            "required": ["message_id"]
+        }
+    ),
+    Tool(
+        name="search_emails",
+        description="Search emails with advanced filtering options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "from": {
+                    "type": "string",
+                    "description": "Filter by sender email address"
                 },
-                "required": ["to", "subject", "body"]
-            }
-        ),
-        Tool(
-            name="mark_email_read",
-            description="Mark an email as read",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "The ID of the email message to mark as read"
-                    }
+                "to": {
+                    "type": "string",
+                    "description": "Filter by recipient email address"
                 },
-                "required": ["message_id"]
-            }
-        ),
-        Tool(
-            name="mark_email_unread",
-            description="Mark an email as unread",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "The ID of the email message to mark as unread"
-                    }
+                "subject": {
+                    "type": "string",
+                    "description": "Filter by subject (partial match)"
                 },
-                "required": ["message_id"]
-            }
-        ),
-        Tool(
-            name="delete_email",
-            description="Delete an email from Gmail",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "The ID of the email message to delete"
-                    }
+                "has_attachment": {
+                    "type": "boolean",
+                    "description": "Filter by whether email has attachments"
                 },
-                "required": ["message_id"]
-            }
-        ),
-        Tool(
-            name="search_emails",
-            description="Search emails with advanced filtering options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "from": {
-                        "type": "string",
-                        "description": "Filter by sender email address"
-                    },
-                    "to": {
-                        "type": "string",
-                        "description": "Filter by recipient email address"
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Filter by subject (partial match)"
-                    },
-                    "has_attachment": {
-                        "type": "boolean",
-                        "description": "Filter by whether email has attachments"
-                    },
-                    "is_unread": {
-                        "type": "boolean",
-                        "description": "Filter by unread status"
-                    },
-                    "is_starred": {
-                        "type": "boolean",
-                        "description": "Filter by starred status"
-                    },
-                    "after_date": {
-                        "type": "string",
-                        "description": "Filter emails after this date (YYYY-MM-DD format)"
-                    },
-                    "before_date": {
-                        "type": "string",
-                        "description": "Filter emails before this date (YYYY-MM-DD format)"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of emails to return (default: 10, max: 500)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 500
-                    }
+                "is_unread": {
+                    "type": "boolean",
+                    "description": "Filter by unread status"
                 },
-                "required": []
-            }
-        )
-    ]
+                "is_starred": {
+                    "type": "boolean",
+                    "description": "Filter by starred status"
+                },
+                "after_date": {
+                    "type": "string",
+                    "description": "Filter emails after this date (YYYY-MM-DD format)"
+                },
+                "before_date": {
+                    "type": "string",
+                    "description": "Filter emails before this date (YYYY-MM-DD format)"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails to return (default: 10, max: 500)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 500
+                }
+            },
+            "required": []
+        }
+    )
+)
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return list(_TOOLS)
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[TextContent]:
@@ -529,14 +570,8 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                 )]
             
             # Get details for each message
-            email_list = []
-            for msg in messages:
-                try:
-                    message_detail = get_message(msg['id'])
-                    parsed = parse_message(message_detail)
-                    email_list.append(parsed)
-                except Exception as e:
-                    continue
+            parsed = (get_parsed_message_or_none(msg['id']) for msg in messages)
+            email_list = [email for email in parsed if email is not None]
             
             # Format response
             formatted = f"Found {len(email_list)} email(s)"
@@ -741,14 +776,8 @@ async def call_tool(name: str, arguments: Optional[dict[str, Any]]) -> list[Text
                     )]
                 
                 # Get details for each message
-                email_list = []
-                for msg in messages:
-                    try:
-                        message_detail = get_message(msg['id'])
-                        parsed = parse_message(message_detail)
-                        email_list.append(parsed)
-                    except Exception as e:
-                        continue
+                parsed = (get_parsed_message_or_none(msg['id']) for msg in messages)
+                email_list = [email for email in parsed if email is not None]
                 
                 # Format response
                 formatted = f"Found {len(email_list)} email(s) matching search criteria\n\n"
@@ -7,6 +7,16 @@ import re
 from html import unescape
 from typing import List, Dict, Any, Optional
 
+# Patterns are compiled once at import rather than looked up (or compiled) on
+# every call.
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_DEFINITION_RE = re.compile(r'(\w+(?:\s+\w+){0,3})\s+(?:is|are|refers to|means|defined as)\s+(.+)', re.IGNORECASE)
+_QA_RE = re.compile(r'[Qq]uestion:\s*(.+?)\s*[Aa]nswer:\s*(.+?)(?:\n|$)', re.DOTALL)
+_LIST_ITEM_RE = re.compile(r'[-*•]\s*(.+?)(?:\n|$)', re.MULTILINE)
+
 
 def extract_text_from_html(html_content: str) -> str:
     """Extract plain text from HTML content.
@@ -21,13 +31,12 @@ def extract_text_from_html(html_content: str) -> str:
         return ""
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html_content)
+    text = _TAG_RE.sub('', html_content)
     # Decode HTML entities
     text = unescape(text)
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove excessive newlines
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    # Clean up whitespace (this also collapses newlines, so no separate
+    # blank-line pass is needed)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -41,7 +50,7 @@ def split_into_sentences(text: str) -> List[str]:
         List of sentences
     """
     # Split by sentence endings
-    sentences = re.split(r'[.!?]\s+', text)
+    sentences = _SENTENCE_END_RE.split(text)
     # Filter out very short sentences
     sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
     return sentences
@@ -60,7 +69,7 @@ def extract_key_terms(text: str, min_length: int = 3) -> List[str]:
     # Convert to lowercase
     text = text.lower()
     # Remove punctuation
-    text = re.sub(r'[^\w\s]', ' ', text)
+    text = _PUNCTUATION_RE.sub(' ', text)
     # Split into words
     words = text.split()
     # Filter common stop words (basic list)
@@ -184,10 +193,8 @@ def generate_qa_pairs_from_content(
     qa_pairs = []
     
     # Pattern 1: Definition patterns (e.g., "X is Y", "X refers to Y")
-    definition_pattern = re.compile(r'(\w+(?:\s+\w+){0,3})\s+(?:is|are|refers to|means|defined as)\s+(.+)', re.IGNORECASE)
-    
     for sentence in sentences:
-        match = definition_pattern.search(sentence)
+        match = _DEFINITION_RE.search(sentence)
         if match:
             term = match.group(1).strip()
             definition = match.group(2).strip()
@@ -200,8 +207,7 @@ def generate_qa_pairs_from_content(
                     break
     
     # Pattern 2: Question-answer format (if content already has Q&A)
-    qa_pattern = re.compile(r'[Qq]uestion:\s*(.+?)\s*[Aa]nswer:\s*(.+?)(?:\n|$)', re.DOTALL)
-    matches = qa_pattern.findall(text)
+    matches = _QA_RE.findall(text)
     for question, answer in matches[:num_pairs]:
         qa_pairs.append({
             "front": question.strip(),
@@ -209,8 +215,7 @@ def generate_qa_pairs_from_content(
         })
     
     # Pattern 3: Lists and bullet points
-    list_pattern = re.compile(r'[-*•]\s*(.+?)(?:\n|$)', re.MULTILINE)
-    list_items = list_pattern.findall(text)
+    list_items = _LIST_ITEM_RE.findall(text)
     for item in list_items[:min(num_pairs, len(list_items))]:
         if len(item) > 20:
             # Split into term and explanation if possible
@@ -5,7 +5,8 @@ Handles storage and management of flashcards in JSON format.
 
 import json
 import os
-from typing import List, Dict, Any, Optional
+import orjson
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 
 FLASHCARD_FILE = "flashcards.json"
@@ -30,9 +31,9 @@ class FlashcardStorage:
         """
         if os.path.exists(self.storage_file):
             try:
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.storage_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            except (orjson.JSONDecodeError, IOError) as e:
                 # If file is corrupted, create a new one
                 print(f"Warning: Could not load flashcard file: {e}. Creating new file.")
                 return self._create_empty_structure()
@@ -54,8 +55,8 @@ class FlashcardStorage:
     def save_flashcards(self):
         """Save flashcards to JSON file."""
         try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(self.flashcards, f, indent=2, ensure_ascii=False)
+            with open(self.storage_file, 'wb') as f:
+                f.write(orjson.dumps(self.flashcards))
         except IOError as e:
             raise Exception(f"Failed to save flashcards: {e}")
     
@@ -446,40 +447,153 @@ FLASHCARD_SETS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirna
 PROGRESS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "flashcards", "progress.json")
 
 
+# Parsed file contents keyed by path, with the (mtime_ns, size) they were read
+# at. Repeated loads within a process skip the re-parse until the file changes.
+_json_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_json(
+    file_path: str,
+    default: Callable[[], Dict[str, Any]],
+    on_parse: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Load a JSON store, reusing the last parse if the file is unchanged.
+    
+    The returned object is shared with the cache: callers that mutate it must
+    save it with _save_json, and read-only callers must not mutate it.
+    
+    Args:
+        file_path: Path to the JSON file
+        default: Factory for the value to use when the file is missing or unreadable
+        on_parse: Optional hook run once on freshly parsed contents (not on cache hits)
+        
+    Returns:
+        Parsed file contents
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return default()
+    
+    cached = _json_cache.get(file_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    try:
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    except (orjson.JSONDecodeError, IOError):
+        return default()
+    if on_parse is not None:
+        on_parse(data)
+    _json_cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _save_json(file_path: str, data: Dict[str, Any]):
+    """Save a JSON store and keep the cache hot with the written value.
+    
+    Stores are written compact: they are machine-read and progress.json is
+    rewritten on every review, so indentation only costs bytes and CPU. The
+    serialized bytes go to a temporary file in one write, which then replaces
+    the store, so a crash mid-save cannot leave a truncated file behind.
+    """
+    tmp_path = file_path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+        os.replace(tmp_path, file_path)
+        st = os.stat(file_path)
+    except Exception:
+        # The caller has already mutated the cached object; drop it so the
+        # next load re-reads what is actually on disk
+        _json_cache.pop(file_path, None)
+        raise
+    _json_cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+
+
+# Secondary index of set IDs by course, paired with the sets data it was built
+# from. Rebuilt lazily when a different (re-parsed) object is loaded, and
+# dropped whenever the sets are saved.
+_course_index: Optional[Tuple[Dict[str, Any], Dict[Any, List[str]]]] = None
+
+
+def _migrate_sets_data(data: Dict[str, Any]):
+    """Convert the legacy list of sets to the dict keyed by set ID."""
+    if isinstance(data.get("sets"), list):
+        data["sets"] = {s["id"]: s for s in data["sets"]}
+
+
 def _load_sets_data() -> Dict[str, Any]:
     """Load flashcard sets from JSON file."""
-    if os.path.exists(FLASHCARD_SETS_FILE):
-        try:
-            with open(FLASHCARD_SETS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {"sets": []}
-    return {"sets": []}
+    return _load_json(FLASHCARD_SETS_FILE, lambda: {"sets": {}}, _migrate_sets_data)
 
 
 def _save_sets_data(data: Dict[str, Any]):
     """Save flashcard sets to JSON file."""
-    os.makedirs(os.path.dirname(FLASHCARD_SETS_FILE), exist_ok=True)
-    with open(FLASHCARD_SETS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    global _course_index
+    _course_index = None
+    _save_json(FLASHCARD_SETS_FILE, data)
+
+
+def _set_ids_for_course(data: Dict[str, Any], course_id: Any) -> List[str]:
+    """Look up the IDs of a course's sets through the course index."""
+    global _course_index
+    if _course_index is None or _course_index[0] is not data:
+        index: Dict[Any, List[str]] = {}
+        for set_id, s in data["sets"].items():
+            index.setdefault(s.get("course_id"), []).append(set_id)
+        _course_index = (data, index)
+    return _course_index[1].get(course_id, [])
 
 
 def _load_progress_data() -> Dict[str, Any]:
     """Load progress data from JSON file."""
-    if os.path.exists(PROGRESS_FILE):
-        try:
-            with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {"sets": {}}
-    return {"sets": {}}
+    return _load_json(PROGRESS_FILE, lambda: {"sets": {}}, _recount_progress)
 
 
 def _save_progress_data(data: Dict[str, Any]):
     """Save progress data to JSON file."""
-    os.makedirs(os.path.dirname(PROGRESS_FILE), exist_ok=True)
-    with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _save_json(PROGRESS_FILE, data)
+
+
+def _recount_progress(data: Dict[str, Any]):
+    """Recompute each set's mastered/needs-review counts from its card entries.
+    
+    The counts are maintained incrementally as cards are added and reviewed;
+    this brings files written before that (whose counts could be stale) back
+    in line once, when the file is parsed.
+    """
+    for set_progress in data.get("sets", {}).values():
+        reviews = set_progress.get("flashcard_reviews", {})
+        mastered_count = sum(1 for c in reviews.values() if c.get("mastered", False))
+        set_progress["mastered_count"] = mastered_count
+        set_progress["needs_review_count"] = len(reviews) - mastered_count
+
+
+def _new_set_progress() -> Dict[str, Any]:
+    """Create the progress entry for a newly tracked set."""
+    return {
+        "flashcard_reviews": {},
+        "last_reviewed": None,
+        "total_reviews": 0,
+        "mastered_count": 0,
+        "needs_review_count": 0
+    }
+
+
+def _new_card_progress() -> Dict[str, Any]:
+    """Create the progress entry for a newly tracked flashcard."""
+    return {
+        "times_reviewed": 0,
+        "times_correct": 0,
+        "times_incorrect": 0,
+        "last_reviewed": None,
+        "mastered": False,
+        "difficulty": "medium"
+    }
 
 
 # Static methods for MCP service
@@ -521,18 +635,12 @@ class FlashcardStorageStatic:
             "updated_at": datetime.now().isoformat()
         }
         
-        data["sets"].append(new_set)
+        data["sets"][set_id] = new_set
         _save_sets_data(data)
         
         # Initialize progress tracking for this set
         progress_data = _load_progress_data()
-        progress_data["sets"][set_id] = {
-            "flashcard_reviews": {},
-            "last_reviewed": None,
-            "total_reviews": 0,
-            "mastered_count": 0,
-            "needs_review_count": 0
-        }
+        progress_data["sets"][set_id] = _new_set_progress()
         _save_progress_data(progress_data)
         
         return set_id
@@ -546,52 +654,33 @@ class FlashcardStorageStatic:
             flashcards: List of flashcard dicts with 'question' and 'answer' keys
         """
         data = _load_sets_data()
-        
-        # Find the set
-        target_set = None
-        for s in data["sets"]:
-            if s["id"] == set_id:
-                target_set = s
-                break
-        
+        target_set = data["sets"].get(set_id)
         if not target_set:
             raise ValueError(f"Flashcard set {set_id} not found")
         
+        # Progress tracking for the new cards is written once for the whole
+        # batch rather than rewriting progress.json after every card
+        progress_data = _load_progress_data()
+        set_progress = progress_data["sets"].setdefault(set_id, _new_set_progress())
+        reviews = set_progress["flashcard_reviews"]
+        now = datetime.now().isoformat()
+        
         # Add flashcards
         for card in flashcards:
             card_id = str(uuid.uuid4())
-            new_card = {
+            target_set["flashcards"].append({
                 "question": card.get("question", ""),
                 "answer": card.get("answer", ""),
                 "tags": card.get("tags", []),
                 "id": card_id,
-                "created_at": datetime.now().isoformat()
-            }
-            target_set["flashcards"].append(new_card)
-            
-            # Initialize progress tracking for this card
-            progress_data = _load_progress_data()
-            if set_id not in progress_data["sets"]:
-                progress_data["sets"][set_id] = {
-                    "flashcard_reviews": {},
-                    "last_reviewed": None,
-                    "total_reviews": 0,
-                    "mastered_count": 0,
-                    "needs_review_count": 0
-                }
-            
-            progress_data["sets"][set_id]["flashcard_reviews"][card_id] = {
-                "times_reviewed": 0,
-                "times_correct": 0,
-                "times_incorrect": 0,
-                "last_reviewed": None,
-                "mastered": False,
-                "difficulty": "medium"
-            }
-            _save_progress_data(progress_data)
+                "created_at": now
+            })
+            reviews[card_id] = _new_card_progress()
+        set_progress["needs_review_count"] += len(flashcards)
         
-        target_set["updated_at"] = datetime.now().isoformat()
+        target_set["updated_at"] = now
         _save_sets_data(data)
+        _save_progress_data(progress_data)
     
     @staticmethod
     def get_flashcard_set(set_id: str) -> Optional[Dict[str, Any]]:
@@ -604,10 +693,7 @@ class FlashcardStorageStatic:
             Flashcard set dict or None
         """
         data = _load_sets_data()
-        for s in data["sets"]:
-            if s["id"] == set_id:
-                return s
-        return None
+        return data["sets"].get(set_id)
     
     @staticmethod
     def get_flashcard_sets_by_course(course_id: int) -> List[Dict[str, Any]]:
@@ -620,7 +706,8 @@ class FlashcardStorageStatic:
             List of flashcard sets
         """
         data = _load_sets_data()
-        return [s for s in data["sets"] if s.get("course_id") == course_id]
+        sets = data["sets"]
+        return [sets[set_id] for set_id in _set_ids_for_course(data, course_id)]
     
     @staticmethod
     def get_flashcards_needing_review(set_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -667,28 +754,14 @@ class FlashcardStorageStatic:
         """
         progress_data = _load_progress_data()
         
-        if set_id not in progress_data["sets"]:
-            progress_data["sets"][set_id] = {
-                "flashcard_reviews": {},
-                "last_reviewed": None,
-                "total_reviews": 0,
-                "mastered_count": 0,
-                "needs_review_count": 0
-            }
+        set_progress = progress_data["sets"].setdefault(set_id, _new_set_progress())
+        reviews = set_progress["flashcard_reviews"]
+        card_progress = reviews.get(flashcard_id)
+        if card_progress is None:
+            card_progress = reviews[flashcard_id] = _new_card_progress()
+            set_progress["needs_review_count"] += 1
+        was_mastered = card_progress.get("mastered", False)
         
-        set_progress = progress_data["sets"][set_id]
-        
-        if flashcard_id not in set_progress["flashcard_reviews"]:
-            set_progress["flashcard_reviews"][flashcard_id] = {
-                "times_reviewed": 0,
-                "times_correct": 0,
-                "times_incorrect": 0,
-                "last_reviewed": None,
-                "mastered": False,
-                "difficulty": "medium"
-            }
-        
-        card_progress = set_progress["flashcard_reviews"][flashcard_id]
         card_progress["times_reviewed"] += 1
         if correct:
             card_progress["times_correct"] += 1
@@ -705,10 +778,10 @@ class FlashcardStorageStatic:
         set_progress["last_reviewed"] = datetime.now().isoformat()
         set_progress["total_reviews"] += 1
         
-        # Update counts
-        mastered_count = sum(1 for c in set_progress["flashcard_reviews"].values() if c.get("mastered", False))
-        set_progress["mastered_count"] = mastered_count
-        set_progress["needs_review_count"] = len(set_progress["flashcard_reviews"]) - mastered_count
+        # Update counts; only this card can have changed state
+        if card_progress["mastered"] and not was_mastered:
+            set_progress["mastered_count"] += 1
+            set_progress["needs_review_count"] -= 1
         
         _save_progress_data(progress_data)
     
@@ -738,7 +811,7 @@ class FlashcardStorageStatic:
             List of all flashcard sets
         """
         data = _load_sets_data()
-        return data.get("sets", [])
+        return list(data["sets"].values())
     
     @staticmethod
     def delete_flashcard_set(set_id: str):
@@ -748,8 +821,8 @@ class FlashcardStorageStatic:
             set_id: Set ID
         """
         data = _load_sets_data()
-        data["sets"] = [s for s in data["sets"] if s["id"] != set_id]
-        _save_sets_data(data)
+        if data["sets"].pop(set_id, None) is not None:
+            _save_sets_data(data)
         
         # Remove progress data
         progress_data = _load_progress_data()
@@ -3,6 +3,7 @@ Production configuration management.
 Handles environment-specific settings and validation.
 """
 import os
+from functools import cached_property, lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field, validator
 import logging
@@ -56,6 +57,9 @@ class Settings(BaseModel):
     rate_limit_enabled: bool = Field(default=True)
     rate_limit_per_minute: int = Field(default=60)
     
+    # Metrics
+    metrics_enabled: bool = Field(default=True)
+    
     # Logging
     log_level: str = Field(default="INFO")
     log_format: str = Field(default="json")
@@ -85,9 +89,9 @@ class Settings(BaseModel):
         """Check if running in development."""
         return self.environment == "development"
     
-    @property
+    @cached_property
     def allowed_origins(self) -> list:
-        """Get list of allowed CORS origins."""
+        """Get list of allowed CORS origins (computed once; settings do not change after load)."""
         origins = [self.frontend_url]
         
         if self.streamlit_url:
@@ -104,20 +108,21 @@ class Settings(BaseModel):
                 "http://127.0.0.1:3000",
             ])
         
-        return list(set(origins))  # Remove duplicates
+        return list(dict.fromkeys(origins))  # Remove duplicates, keeping order
     
     def validate_required_for_production(self):
         """Validate that required settings are present for production."""
         if not self.is_production:
             return
         
-        required_fields = {
-            "openrouter_api_key": self.openrouter_api_key,
-            "supabase_url": self.supabase_url,
-            "supabase_key": self.supabase_key,
-        }
-        
-        missing = [k for k, v in required_fields.items() if not v]
+        missing = [
+            name for name, value in (
+                ("openrouter_api_key", self.openrouter_api_key),
+                ("supabase_url", self.supabase_url),
+                ("supabase_key", self.supabase_key),
+            )
+            if not value
+        ]
         
         if missing:
             raise ValueError(
@@ -133,28 +138,26 @@ class Settings(BaseModel):
 
 
 # Global settings instance
-_settings: Optional[Settings] = None
+@lru_cache(maxsize=1)
+def _load_settings() -> Settings:
+    """Load and validate settings once; later calls return the cached instance."""
+    try:
+        settings = Settings()
+        settings.validate_required_for_production()
+        logger.info(f"Settings loaded for environment: {settings.environment}")
+    except Exception as e:
+        logger.error(f"Failed to load settings: {e}")
+        raise
+    
+    return settings
 
 
 def get_settings() -> Settings:
     """Get application settings (singleton pattern)."""
-    global _settings
-    
-    if _settings is None:
-        try:
-            _settings = Settings()
-            _settings.validate_required_for_production()
-            logger.info(f"Settings loaded for environment: {_settings.environment}")
-        except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
-            raise
-    
-    return _settings
+    return _load_settings()
 
 
 def reload_settings():
     """Reload settings (useful for testing)."""
-    global _settings
-    _settings = None
+    _load_settings.cache_clear()
     return get_settings()
-
@@ -0,0 +1,75 @@
+"""
+HTTP transport helpers for Google API clients.
+"""
+import threading
+
+import httplib2
+import google_auth_httplib2
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+
+# Socket timeout for Google API requests, in seconds
+REQUEST_TIMEOUT = 60
+
+
+def _single_flight_refresh(credentials):
+    """Make concurrent refreshes of credentials share one token request.
+
+    google-auth already refreshes ahead of expiry (credentials count as expired
+    a few minutes early), but every thread that sees the stale token refreshes
+    it separately. Threads that wait here while another thread refreshes reuse
+    the new token instead of requesting their own.
+    """
+    lock = threading.Lock()
+    refresh = credentials.refresh
+
+    def locked_refresh(request):
+        stale_token = credentials.token
+        with lock:
+            if credentials.token != stale_token and credentials.valid:
+                return
+            refresh(request)
+
+    credentials.refresh = locked_refresh
+
+
+def build_service(service_name: str, version: str, credentials):
+    """Build a Google API service whose requests reuse kept-alive connections.
+
+    httplib2.Http is not thread-safe, so the default service (one Http shared by
+    every request) cannot be used from a thread pool. Each thread executing this
+    service's requests gets its own authorized Http instead, created on first use
+    and kept, so its TLS connection is reused across that thread's calls. Token
+    refreshes are shared between threads (see _single_flight_refresh).
+
+    Args:
+        service_name: API name (e.g. 'calendar', 'gmail')
+        version: API version (e.g. 'v3')
+        credentials: google.oauth2 credentials to authorize requests with
+
+    Returns:
+        Service resource, as returned by googleapiclient.discovery.build
+    """
+    _single_flight_refresh(credentials)
+    local = threading.local()
+
+    def request_builder(http, *args, **kwargs):
+        authed_http = getattr(local, "http", None)
+        if authed_http is None:
+            authed_http = local.http = google_auth_httplib2.AuthorizedHttp(
+                credentials,
+                http=httplib2.Http(timeout=REQUEST_TIMEOUT)
+            )
+        return HttpRequest(authed_http, *args, **kwargs)
+
+    # The discovery document ships with googleapiclient (static_discovery), so no
+    # discovery request is made; cache_discovery=False skips the legacy file
+    # cache lookup, which only adds a failed import and a logged warning per build.
+    return build(
+        service_name,
+        version,
+        credentials=credentials,
+        requestBuilder=request_builder,
+        static_discovery=True,
+        cache_discovery=False
+    )
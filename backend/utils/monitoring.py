@@ -2,28 +2,71 @@
 Monitoring and metrics utilities for production deployment.
 """
 import time
+import bisect
+from array import array
 import logging
-from typing import Dict, Any, Optional
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
 import asyncio
 
+from backend.utils.config import get_settings
+
 logger = logging.getLogger(__name__)
 
+# Number of most recent response times kept for percentiles
+MAX_RESPONSE_TIMES = 1000
+
+# (second, formatted timestamp) last produced by utc_timestamp()
+_timestamp_cache: List[Any] = [0, ""]
+
+
+def utc_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string, formatted at most once per second."""
+    now_second = int(time.time())
+    if now_second != _timestamp_cache[0]:
+        _timestamp_cache[:] = [now_second, datetime.fromtimestamp(now_second, timezone.utc).isoformat()]
+    return _timestamp_cache[1]
+
+
+class EndpointStat:
+    """Request count, error count and total time for one endpoint."""
+    
+    __slots__ = ("count", "errors", "total_time")
+    
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the stats as a dictionary."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time
+        }
+
 
 class RequestMetrics:
     """Track request metrics for monitoring."""
     
     def __init__(self, window_minutes: int = 60):
         self.window_minutes = window_minutes
-        self.requests = deque()
-        self.errors = deque()
-        self.response_times = deque()
-        self.endpoint_stats = defaultdict(lambda: {
-            "count": 0,
-            "errors": 0,
-            "total_time": 0.0
-        })
+        # Per-second request/error counts in a ring covering the window, with
+        # running totals, so recording and expiry do not depend on traffic volume
+        self._window_seconds = window_minutes * 60
+        self._request_counts = [0] * self._window_seconds
+        self._error_counts = [0] * self._window_seconds
+        self._head_second = int(time.monotonic())
+        self._total_requests = 0
+        self._total_errors = 0
+        self.response_times = deque(maxlen=MAX_RESPONSE_TIMES)
+        # The same response times kept in sorted order, so percentiles are
+        # read by index instead of sorting on every get_metrics call; stored
+        # as a packed array of doubles rather than a list of float objects
+        self._sorted_response_times = array("d")
+        self.endpoint_stats: Dict[Tuple[str, str], EndpointStat] = {}
     
     def record_request(
         self,
@@ -34,72 +77,76 @@ class RequestMetrics:
         error: Optional[str] = None
     ):
         """Record a request."""
-        now = time.time()
-        
         # Clean old entries
         self._clean_old_entries()
         
         # Record request
-        self.requests.append({
-            "timestamp": now,
-            "endpoint": endpoint,
-            "method": method,
-            "status_code": status_code,
-            "duration": duration,
-            "error": error
-        })
-        
-        # Track response time
+        slot = self._head_second % self._window_seconds
+        self._request_counts[slot] += 1
+        self._total_requests += 1
+        
+        # Track response time (the most recent MAX_RESPONSE_TIMES)
+        # (the deque drops its oldest entry itself on append once full)
+        if len(self.response_times) == MAX_RESPONSE_TIMES:
+            oldest = self.response_times[0]
+            del self._sorted_response_times[bisect.bisect_left(self._sorted_response_times, oldest)]
         self.response_times.append(duration)
+        bisect.insort(self._sorted_response_times, duration)
         
         # Track errors
         if status_code >= 400 or error:
-            self.errors.append({
-                "timestamp": now,
-                "endpoint": endpoint,
-                "status_code": status_code,
-                "error": error
-            })
-        
-        # Update endpoint stats
-        key = f"{method}:{endpoint}"
-        self.endpoint_stats[key]["count"] += 1
-        self.endpoint_stats[key]["total_time"] += duration
+            self._error_counts[slot] += 1
+            self._total_errors += 1
+        
+        # Update endpoint stats (keyed by tuple; formatted as "METHOD:path" on read)
+        key = (method, endpoint)
+        stat = self.endpoint_stats.get(key)
+        if stat is None:
+            stat = self.endpoint_stats[key] = EndpointStat()
+        stat.count += 1
+        stat.total_time += duration
         if status_code >= 400 or error:
-            self.endpoint_stats[key]["errors"] += 1
+            stat.errors += 1
     
     def _clean_old_entries(self):
         """Remove entries outside the time window."""
-        cutoff = time.time() - (self.window_minutes * 60)
+        now_second = int(time.monotonic())
         
-        while self.requests and self.requests[0]["timestamp"] < cutoff:
-            self.requests.popleft()
-        
-        while self.errors and self.errors[0]["timestamp"] < cutoff:
-            self.errors.popleft()
-        
-        while self.response_times and len(self.response_times) > 1000:
-            self.response_times.popleft()
+        # Clear the ring slots of the seconds that fell out of the window;
+        # at most one full pass however long the gap since the last call
+        start = max(self._head_second + 1, now_second - self._window_seconds + 1)
+        for second in range(start, now_second + 1):
+            slot = second % self._window_seconds
+            self._total_requests -= self._request_counts[slot]
+            self._total_errors -= self._error_counts[slot]
+            self._request_counts[slot] = 0
+            self._error_counts[slot] = 0
+        self._head_second = max(self._head_second, now_second)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics."""
         self._clean_old_entries()
         
-        total_requests = len(self.requests)
-        total_errors = len(self.errors)
+        total_requests = self._total_requests
+        total_errors = self._total_errors
         
-        # Calculate percentiles for response times
-        sorted_times = sorted(self.response_times)
-        
-        def percentile(p):
-            if not sorted_times:
-                return 0
-            k = (len(sorted_times) - 1) * p
+        # Calculate percentiles for response times (linear interpolation
+        # between the two nearest ranks)
+        sorted_times = self._sorted_response_times
+        n = len(sorted_times)
+        p50 = p95 = p99 = mean = 0
+        if n:
+            last = n - 1
+            k = last * 0.50
+            f = int(k)
+            p50 = sorted_times[f] if f == last else sorted_times[f] * (f + 1 - k) + sorted_times[f + 1] * (k - f)
+            k = last * 0.95
             f = int(k)
-            c = f + 1
-            if c >= len(sorted_times):
-                return sorted_times[f]
-            return sorted_times[f] * (c - k) + sorted_times[c] * (k - f)
+            p95 = sorted_times[f] if f == last else sorted_times[f] * (f + 1 - k) + sorted_times[f + 1] * (k - f)
+            k = last * 0.99
+            f = int(k)
+            p99 = sorted_times[f] if f == last else sorted_times[f] * (f + 1 - k) + sorted_times[f + 1] * (k - f)
+            mean = sum(sorted_times) / n
         
         return {
             "total_requests": total_requests,
@@ -107,12 +154,15 @@ class RequestMetrics:
             "error_rate": total_errors / total_requests if total_requests > 0 else 0,
             "requests_per_minute": total_requests / self.window_minutes,
             "response_time": {
-                "p50": percentile(0.50),
-                "p95": percentile(0.95),
-                "p99": percentile(0.99),
-                "mean": sum(sorted_times) / len(sorted_times) if sorted_times else 0
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "mean": mean
+            },
+            "endpoint_stats": {
+                f"{method}:{endpoint}": stat.to_dict()
+                for (method, endpoint), stat in self.endpoint_stats.items()
             },
-            "endpoint_stats": dict(self.endpoint_stats),
             "window_minutes": self.window_minutes
         }
     
@@ -145,53 +195,72 @@ class RequestMetrics:
             "status": status,
             "issues": issues,
             "metrics": metrics,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": utc_timestamp()
         }
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter."""
+    """Simple in-memory rate limiter.
+    
+    Token bucket per identifier: up to max_requests may be made at once,
+    and the allowance refills at max_requests per window_seconds. At most
+    max_identifiers buckets are kept; the least recently seen identifier is
+    evicted (and starts over with a full bucket) when the cap is exceeded.
+    """
     
-    def __init__(self, max_requests: int, window_seconds: int = 60):
+    def __init__(self, max_requests: int, window_seconds: int = 60, max_identifiers: int = 10000):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(deque)
+        self.refill_rate = max_requests / window_seconds
+        self.max_identifiers = max_identifiers
+        # (tokens, last update time) per identifier, on the monotonic clock,
+        # in least- to most-recently-seen order
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+    
+    def _tokens(self, identifier: str, now: float) -> float:
+        """Get the tokens an identifier has available at time now."""
+        bucket = self.buckets.get(identifier)
+        if bucket is None:
+            return float(self.max_requests)
+        tokens, last = bucket
+        return min(self.max_requests, tokens + (now - last) * self.refill_rate)
     
     def is_allowed(self, identifier: str) -> bool:
         """Check if request is allowed under rate limit."""
-        now = time.time()
-        cutoff = now - self.window_seconds
-        
-        # Clean old requests
-        while self.requests[identifier] and self.requests[identifier][0] < cutoff:
-            self.requests[identifier].popleft()
+        now = time.monotonic()
+        buckets = self.buckets
+        # Inlined _tokens(): a single dict lookup on the per-request path
+        bucket = buckets.get(identifier)
+        if bucket is None:
+            tokens = float(self.max_requests)
+        else:
+            tokens = min(self.max_requests, bucket[0] + (now - bucket[1]) * self.refill_rate)
         
-        # Check limit
-        if len(self.requests[identifier]) >= self.max_requests:
+        # Check limit (a limited identifier always has a bucket; keep it from
+        # being evicted, which would reset its allowance)
+        if tokens < 1:
+            buckets.move_to_end(identifier)
             return False
         
         # Record request
-        self.requests[identifier].append(now)
+        buckets[identifier] = (tokens - 1, now)
+        buckets.move_to_end(identifier)
+        if len(buckets) > self.max_identifiers:
+            buckets.popitem(last=False)
         return True
     
     def get_remaining(self, identifier: str) -> int:
         """Get remaining requests in window."""
-        now = time.time()
-        cutoff = now - self.window_seconds
-        
-        # Clean old requests
-        while self.requests[identifier] and self.requests[identifier][0] < cutoff:
-            self.requests[identifier].popleft()
-        
-        return max(0, self.max_requests - len(self.requests[identifier]))
+        return int(self._tokens(identifier, time.monotonic()))
     
     def get_reset_time(self, identifier: str) -> Optional[float]:
-        """Get time when rate limit resets."""
-        if not self.requests[identifier]:
+        """Get time when rate limit resets (the allowance is full again)."""
+        tokens = self._tokens(identifier, time.monotonic())
+        if tokens >= self.max_requests:
             return None
         
-        oldest = self.requests[identifier][0]
-        return oldest + self.window_seconds
+        # Buckets are tracked on the monotonic clock; report wall-clock time
+        return time.time() + (self.max_requests - tokens) / self.refill_rate
 
 
 # Global instances
@@ -204,10 +273,16 @@ rate_limiter = RateLimiter(max_requests=60, window_seconds=60)
 # ==========================================
 
 def track_request(endpoint: str, method: str):
-    """Decorator to track request metrics."""
+    """Decorator to track request metrics.
+    
+    When metrics are disabled in settings, handlers are returned unwrapped.
+    """
+    if not get_settings().metrics_enabled:
+        return lambda func: func
+    
     def decorator(func):
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.monotonic()
             error = None
             status_code = 200
             
@@ -219,7 +294,7 @@ def track_request(endpoint: str, method: str):
                 status_code = 500
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 request_metrics.record_request(
                     endpoint=endpoint,
                     method=method,
@@ -236,8 +311,9 @@ async def log_system_metrics():
     """Periodically log system metrics."""
     while True:
         try:
-            metrics = request_metrics.get_metrics()
+            # get_health_status embeds get_metrics(); reuse it instead of computing twice
             health = request_metrics.get_health_status()
+            metrics = health["metrics"]
             
             logger.info(f"System Health: {health['status']}")
             logger.info(f"Requests/min: {metrics['requests_per_minute']:.2f}")
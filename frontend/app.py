@@ -107,7 +107,7 @@ def main():
         
         # Connection test button
         if st.button("Test Backend Connection"):
-            if check_backend_connection(API_URL):
+            if check_backend_connection(API_URL, refresh=True):
                 st.success("✅ Backend is accessible!")
             else:
                 st.error("❌ Cannot reach backend")
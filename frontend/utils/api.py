@@ -2,22 +2,58 @@
 API utilities for communicating with the backend.
 """
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 
+# Most recent user/assistant turns sent to the backend with each message. The
+# full conversation stays in session state for display; older turns are not
+# re-sent, which keeps the request and prompt size bounded in long chats.
+MAX_HISTORY_TURNS = 12
 
-def check_backend_connection(api_url: str) -> bool:
+# Shared session so backend calls reuse pooled keep-alive connections instead
+# of opening a new one per request. The module is imported once per process,
+# so Streamlit reruns keep using the same session.
+_SESSION = requests.Session()
+for _prefix in ("http://", "https://"):
+    _SESSION.mount(_prefix, HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    ))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_health(api_url: str) -> bool:
+    """Probe the backend's /health endpoint, caching successes for 30 seconds.
+    
+    Failures raise instead of returning False, so they are not cached and a
+    backend that was just started is seen on the next check.
+    """
+    response = _SESSION.get(f"{api_url}/health", timeout=2)
+    response.raise_for_status()
+    return True
+
+
+def check_backend_connection(api_url: str, refresh: bool = False) -> bool:
     """
     Check if backend is accessible.
     
+    A successful check is reused for 30 seconds, so Streamlit reruns do not
+    re-probe the backend on every interaction.
+    
     Args:
         api_url: URL of the backend API
+        refresh: Drop any cached result and probe the backend again
     
     Returns:
         True if backend is accessible, False otherwise
     """
+    if refresh:
+        _cached_health.clear()
     try:
-        response = requests.get(f"{api_url}/health", timeout=2)
-        return response.status_code == 200
+        return _cached_health(api_url)
     except:
         return False
 
@@ -34,7 +70,9 @@ def send_message(
     Args:
         api_url: URL of the backend API
         query: User's query
-        conversation_history: List of previous messages
+        conversation_history: List of previous messages, optionally ending
+            with the query itself (only the last MAX_HISTORY_TURNS
+            user/assistant pairs before the query are sent)
         user_id: Optional user ID for per-user credentials
     
     Returns:
@@ -42,9 +80,14 @@ def send_message(
     """
     try:
         # Prepare conversation history
+        # The caller may already have appended the pending query; it is sent
+        # as "query", so leave it out of the history window
+        previous = conversation_history
+        if previous and previous[-1]["role"] == "user" and previous[-1]["content"] == query:
+            previous = previous[:-1]
         history = [
             {"role": msg["role"], "content": msg["content"]}
-            for msg in conversation_history
+            for msg in previous[-MAX_HISTORY_TURNS * 2:]
         ]
         
         payload = {
@@ -55,7 +98,7 @@ def send_message(
         if user_id:
             payload["user_id"] = user_id
         
-        response = requests.post(f"{api_url}/chat", json=payload, timeout=120)
+        response = _SESSION.post(f"{api_url}/chat", json=payload, timeout=120)
         response.raise_for_status()
         result = response.json()
         return result.get("response", "No response received")
@@ -87,7 +130,7 @@ def store_credentials(
         True if successful, False otherwise
     """
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{api_url}/auth/credentials",
             json={
                 "user_id": user_id,
@@ -118,7 +161,7 @@ def get_credentials(
         Credentials dictionary or None
     """
     try:
-        response = requests.get(
+        response = _SESSION.get(
             f"{api_url}/auth/credentials/{user_id}/{service}",
             timeout=10
         )
@@ -0,0 +1,79 @@
+"""
+Tests for the Canvas MCP server helpers.
+"""
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from backend.mcp_servers import canvas_server
+
+
+COURSE = {"id": 101, "name": "Biology"}
+NOW = datetime(2025, 3, 28, 12, 0, tzinfo=timezone.utc)
+
+
+def _next_period_assignment():
+    """An assignment due within the week but in the next grading period."""
+    due_at = (NOW + timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        "name": "Lab report",
+        "due_at": due_at,
+        "points_possible": 20.0,
+        "html_url": "https://canvas.example/courses/101/assignments/7"
+    }
+
+
+class FakeCanvas:
+    """Canvas client whose GraphQL API behaves like Canvas's for grading periods.
+
+    assignmentsConnection only includes assignments outside the current grading
+    period when the query asks for all periods with `gradingPeriodId: null`.
+    """
+
+    def __init__(self, assignment, graphql_available=True):
+        self.assignment = assignment
+        self.graphql_available = graphql_available
+
+    def graphql(self, query, variables=None):
+        if not self.graphql_available:
+            raise canvas_server.CanvasException("GraphQL unavailable")
+
+        nodes = []
+        if "gradingPeriodId: null" in query:
+            nodes.append({
+                "name": self.assignment["name"],
+                "dueAt": self.assignment["due_at"],
+                "pointsPossible": self.assignment["points_possible"],
+                "htmlUrl": self.assignment["html_url"]
+            })
+        return {"data": {
+            alias: {"assignmentsConnection": {"nodes": nodes, "pageInfo": {"hasNextPage": False}}}
+            for alias in variables
+        }}
+
+
+class FetchUpcomingAssignmentsTest(unittest.TestCase):
+    """fetch_upcoming_assignments returns the same result over GraphQL and REST."""
+
+    def _fetch(self, canvas, assignment):
+        rest_course = mock.Mock()
+        rest_course.get_assignments.return_value = [SimpleNamespace(**assignment)]
+        with mock.patch.object(canvas_server, "get_canvas_client", return_value=canvas), \
+                mock.patch.object(canvas_server, "get_local_now", return_value=NOW), \
+                mock.patch.object(canvas_server, "fetch_courses", return_value=[COURSE]), \
+                mock.patch.object(canvas_server, "get_course_ref", return_value=rest_course):
+            return canvas_server.fetch_upcoming_assignments(days=7)
+
+    def test_batched_matches_rest_for_assignment_outside_current_period(self):
+        assignment = _next_period_assignment()
+
+        batched = self._fetch(FakeCanvas(assignment), assignment)
+        rest = self._fetch(FakeCanvas(assignment, graphql_available=False), assignment)
+
+        self.assertEqual(len(rest), 1)
+        self.assertEqual(batched, rest)
+
+
+if __name__ == "__main__":
+    unittest.main()